@@ -4,12 +4,15 @@
 提供应用程序配置的加载、保存和验证功能。
 """
 
+import copy
 import json
 import os
 import re
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from src.utils.logger import get_logger
 from src.core.interfaces import IConfigManager
@@ -109,6 +112,10 @@ class ConfigManager(IConfigManager):
         """初始化配置管理器。"""
         self._config: dict[str, Any] = {}
         self._cache: dict[str, Any] = {}
+        self._save_lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
+        self._config_version = 0
         self._ensure_config_dir()
         self._ensure_default_config()
 
@@ -228,6 +235,7 @@ class ConfigManager(IConfigManager):
         返回:
             配置字典
         """
+        self._config_version += 1
         try:
             if not self.CONFIG_FILE.exists():
                 logger.info(f"配置文件不存在，创建默认配置: {self.CONFIG_FILE}")
@@ -317,15 +325,23 @@ class ConfigManager(IConfigManager):
             config: 要保存的配置字典，如果为 None 则保存当前配置
         """
         try:
-            if config is not None:
-                self._config = config
+            with self._save_lock:
+                if config is not None:
+                    self._config = config
 
-            self.validate_config(self._config)
+                self.validate_config(self._config)
+                self._config_version += 1
 
-            config_to_save = self._config.copy()
-            
-            logger.debug(f"保存配置到 {self.CONFIG_FILE}")
-            _atomic_save_json(self.CONFIG_FILE, config_to_save, indent=2)
+                if self._batch_depth:
+                    self._dirty = True
+                    logger.debug("批量模式中，延迟保存配置")
+                    return
+
+                # 深拷贝后再序列化，json.dump 遍历的是快照而不是其他线程仍在修改的嵌套字典
+                config_to_save = copy.deepcopy(self._config)
+
+                logger.debug(f"保存配置到 {self.CONFIG_FILE}")
+                _atomic_save_json(self.CONFIG_FILE, config_to_save, indent=2)
             logger.debug("配置保存成功")
         except ConfigValidationError as e:
             logger.error(f"配置验证失败，无法保存: {e}")
@@ -334,6 +350,27 @@ class ConfigManager(IConfigManager):
             logger.error(f"保存配置失败: {e}")
             raise ConfigSaveError(f"无法保存配置到 {self.CONFIG_FILE}: {e}") from e
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        批量修改配置的上下文管理器。
+        
+        在上下文中调用 save_config 只标记配置已修改，退出最外层上下文时
+        统一写入一次文件。支持嵌套使用。
+        """
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                flush = self._batch_depth == 0 and self._dirty
+                if flush:
+                    self._dirty = False
+            if flush:
+                self.save_config()
+
     def save_cache(self, cache: dict[str, Any] | None = None) -> None:
         """
         保存缓存到文件。
@@ -342,11 +379,12 @@ class ConfigManager(IConfigManager):
             cache: 要保存的缓存字典，如果为 None 则保存当前缓存
         """
         try:
-            if cache is not None:
-                self._cache = cache
-
             logger.debug(f"保存缓存到 {self.CACHE_FILE}")
-            _atomic_save_json(self.CACHE_FILE, self._cache, indent=2)
+            with self._save_lock:
+                if cache is not None:
+                    self._cache = cache
+                # 在锁内写出浅拷贝，其他线程的 set_cache 不会在序列化过程中修改字典
+                _atomic_save_json(self.CACHE_FILE, dict(self._cache), indent=2)
             logger.debug("缓存保存成功")
         except (IOError, OSError, json.JSONDecodeError) as e:
             logger.error(f"保存缓存失败: {e}")
@@ -357,8 +395,7 @@ class ConfigManager(IConfigManager):
         清空缓存。
         """
         logger.info("清空缓存")
-        self._cache = {}
-        self.save_cache()
+        self.save_cache({})
         logger.info("缓存已清空")
 
     def validate_config(self, config: dict[str, Any]) -> bool:
@@ -404,6 +441,30 @@ class ConfigManager(IConfigManager):
 
 
 
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        获取配置锁。
+        
+        后台线程对配置做读取-修改-保存时应持有此锁，与 save_config 的序列化互斥。
+        
+        返回:
+            可重入锁
+        """
+        return self._save_lock
+
+    @property
+    def config_version(self) -> int:
+        """
+        获取配置版本号。
+        
+        每次加载或修改配置时递增，调用方可据此判断派生数据是否需要重建。
+        
+        返回:
+            配置版本号
+        """
+        return self._config_version
+
     @property
     def config(self) -> dict[str, Any]:
         """
@@ -447,6 +508,7 @@ class ConfigManager(IConfigManager):
             value: 配置值
         """
         self._config[key] = value
+        self._config_version += 1
 
     def get_settings(self) -> dict[str, Any]:
         """
@@ -624,7 +686,19 @@ class ConfigManager(IConfigManager):
             key: 缓存键名
             value: 缓存值
         """
-        self._cache[key] = value
+        with self._save_lock:
+            self._cache[key] = value
+
+    def update_cache(self, entries: dict[str, Any]) -> None:
+        """
+        批量设置缓存值并保存到文件，设置与保存在同一把锁内完成。
+        
+        参数:
+            entries: 缓存键名到缓存值的映射
+        """
+        with self._save_lock:
+            self._cache.update(entries)
+            self.save_cache()
 
     def reset_to_default(self) -> dict[str, Any]:
         """
@@ -648,10 +722,6 @@ class ConfigManager(IConfigManager):
         返回:
             成功返回 True，工具已存在返回 False
         """
-        from ..utils.logger import get_logger
-        
-        logger = get_logger()
-        
         try:
             InputValidator.validate_tool_name(tool_name)
         except InputValidationError as e:
@@ -810,8 +880,6 @@ class ConfigManager(IConfigManager):
             self.save_config(current_config)
             return True
         except Exception as e:
-            from ..utils.logger import get_logger
-            logger = get_logger()
             logger.error(f"保存工具特定配置失败: {e}")
             return False
     
@@ -880,7 +948,5 @@ class ConfigManager(IConfigManager):
             self.save_config(config)
             return True
         except Exception as e:
-            from ..utils.logger import get_logger
-            logger = get_logger()
             logger.error(f"删除工具配置失败: {e}")
             return False
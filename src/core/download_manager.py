@@ -17,7 +17,7 @@ import requests
 from src.utils.logger import get_logger
 from src.core.config_manager import ConfigManager
 from src.utils.retry import RetryHandler
-from src.utils.speed_limiter import SpeedLimiter
+from src.utils.speed_limiter import SpeedLimiter, ThrottledWriter
 from src.utils.download_history import DownloadHistory
 from src.utils.rate_limiter import RateLimiter
 
@@ -64,8 +64,9 @@ class DownloadManager:
         retry_count = config_manager.get_download_retry_count()
         self.retry_handler = RetryHandler(max_retries=retry_count)
         speed_limit = config_manager.get_download_speed_limit()
-        self.speed_limiter = SpeedLimiter(speed_limit_bytes=speed_limit)
+        self.speed_limiter = SpeedLimiter(speed_limit_bytes=speed_limit, bucket_name="download")
         self.download_history = DownloadHistory(self.config_manager.CONFIG_DIR)
+        self._session = requests.Session()
     
     def _build_download_url(self, tool: str, version: str, mirror_url: str) -> str:
         """
@@ -211,7 +212,7 @@ class DownloadManager:
         if downloaded > 0:
             headers["Range"] = f"bytes={downloaded}-"
         
-        response = requests.head(download_url, headers=headers, timeout=10, allow_redirects=True)
+        response = self._session.head(download_url, headers=headers, timeout=10, allow_redirects=True)
         
         if downloaded > 0 and response.status_code == 206:
             content_range = response.headers.get("Content-Range", "")
@@ -255,14 +256,10 @@ class DownloadManager:
             path: 安装路径
         """
         config = self.config_manager.get_config()
-        if "tools" not in config:
-            config["tools"] = {}
-        if tool not in config["tools"]:
-            config["tools"][tool] = {
-                "installed_versions": [],
-                "current_version": None
-            }
-        installed = config["tools"][tool]["installed_versions"]
+        tool_cfg = config.setdefault("tools", {}).setdefault(
+            tool, {"installed_versions": [], "current_version": None}
+        )
+        installed = tool_cfg.setdefault("installed_versions", [])
         existing = next((v for v in installed if v["version"] == version), None)
         if existing:
             existing["path"] = path
@@ -360,7 +357,7 @@ class DownloadManager:
                 
                 def _do_download():
                     self.rate_limiter.acquire()
-                    return requests.get(download_url, headers=headers, stream=True, timeout=300)
+                    return self._session.get(download_url, headers=headers, stream=True, timeout=300)
                 
                 response = self.retry_handler.execute(_do_download)
                 response.raise_for_status()
@@ -368,10 +365,10 @@ class DownloadManager:
                 if total_size == 0:
                     total_size = int(response.headers.get("content-length", 0)) + downloaded
                 
-                with open(temp_path, mode) as f:
+                with open(temp_path, mode) as f, ThrottledWriter(f, self.speed_limiter) as writer:
                     for chunk in response.iter_content(chunk_size=8192):
                         if chunk:
-                            self.speed_limiter.write_with_limit(f, chunk)
+                            writer.write(chunk)
                             downloaded += len(chunk)
                             if progress_callback and total_size > 0:
                                 progress_callback(downloaded, total_size)
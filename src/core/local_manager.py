@@ -158,35 +158,52 @@ class LocalManager(ILocalManager):
         返回:
             版本信息列表，每个元素包含 version、path、install_date
         """
+        entries = self.scan_version_dirs(tool)
+        if entries is None:
+            return []
+        return self.apply_installed_state(tool, entries)
+    
+    def scan_version_dirs(self, tool: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        扫描工具根目录下的版本目录（不含配置中的锁定/系统状态）。
+        
+        参数:
+            tool: 工具名称
+            
+        返回:
+            版本目录信息列表，每个元素包含 version、path、install_date；
+            扫描失败返回 None
+        """
         try:
             try:
                 InputValidator.validate_tool_name(tool)
             except InputValidationError as e:
                 logger.error(f"工具名称验证失败: {e}")
-                return []
+                return None
                 
             if not tool:
                 logger.warning("扫描本地版本失败: 工具名称为空")
-                return []
+                return None
                 
             root_path = self.config_manager.get_normalized_tool_root(tool)
             if not root_path or not os.path.exists(root_path):
                 logger.info(f"工具 {tool} 的根目录不存在: {root_path}")
-                return []
+                return None
                 
             logger.debug(f"开始扫描 {tool} 的本地版本，根目录: {root_path}")
             versions = []
-            config = self.config_manager.get_config()
-            existing_installed = config.get("tools", {}).get(tool, {}).get("installed_versions", [])
-            current_version = config.get("tools", {}).get(tool, {}).get("current_version")
-            existing_by_path = {v.get("path"): v for v in existing_installed}
             
-            for item in os.listdir(root_path):
+            # 跳过以 . 开头的隐藏目录（包括删除版本时使用的回收目录）
+            with os.scandir(root_path) as entries:
+                dir_entries = [
+                    entry for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
+            
+            for entry in dir_entries:
+                item = entry.name
                 try:
-                    item_path = os.path.join(root_path, item)
-                    if not os.path.isdir(item_path):
-                        continue
-                        
+                    item_path = entry.path
                     if self._validate_tool_installation(tool, item_path):
                         folder_version = self._extract_and_validate_version(tool, item)
                         real_version = self.get_tool_version_by_cmd(tool, item_path)
@@ -205,39 +222,60 @@ class LocalManager(ILocalManager):
                             continue
                             
                         install_date = datetime.fromtimestamp(
-                            os.path.getctime(item_path)
+                            entry.stat().st_ctime
                         ).isoformat()
                         
-                        locked = False
-                        is_system = False
-                        if item_path in existing_by_path:
-                            locked = existing_by_path[item_path].get("locked", False)
-                            is_system = existing_by_path[item_path].get("is_system", False)
-                        
-                        if version_str == current_version and not is_system:
-                            is_system = True
-                        
                         versions.append({
                             "version": version_str,
                             "path": item_path,
-                            "install_date": install_date,
-                            "locked": locked,
-                            "is_system": is_system
+                            "install_date": install_date
                         })
                 except Exception as e:
                     logger.warning(f"处理目录 {item} 时出错: {e}")
                     continue
                     
             logger.info(f"找到 {len(versions)} 个 {tool} 本地版本")
-            self._update_installed_versions_from_scan(tool, versions)
             return versions
             
         except OSError as e:
             logger.error(f"扫描 {tool} 本地版本时发生文件系统错误: {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"扫描 {tool} 本地版本失败: {e}")
-            return []
+            return None
+    
+    def apply_installed_state(self, tool: str, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        根据配置为版本目录补充锁定/系统状态，并同步到配置中的已安装版本。
+        
+        参数:
+            tool: 工具名称
+            entries: scan_version_dirs 返回的版本目录列表（不会被修改）
+            
+        返回:
+            版本信息列表，每个元素包含 version、path、install_date、locked、is_system
+        """
+        config = self.config_manager.get_config()
+        existing_installed = config.get("tools", {}).get(tool, {}).get("installed_versions", [])
+        current_version = config.get("tools", {}).get(tool, {}).get("current_version")
+        existing_by_path = {v.get("path"): v for v in existing_installed}
+        
+        versions = []
+        for entry in entries:
+            locked = False
+            is_system = False
+            existing = existing_by_path.get(entry["path"])
+            if existing is not None:
+                locked = existing.get("locked", False)
+                is_system = existing.get("is_system", False)
+            
+            if entry["version"] == current_version and not is_system:
+                is_system = True
+            
+            versions.append({**entry, "locked": locked, "is_system": is_system})
+        
+        self._update_installed_versions_from_scan(tool, versions)
+        return versions
     
     def _update_installed_versions_from_scan(self, tool: str, versions: List[Dict[str, Any]]) -> None:
         """
@@ -247,44 +285,42 @@ class LocalManager(ILocalManager):
             tool: 工具名称
             versions: 扫描到的版本列表
         """
-        config = self.config_manager.get_config()
-        if "tools" not in config:
-            config["tools"] = {}
-        if tool not in config["tools"]:
-            config["tools"][tool] = {
-                "installed_versions": [],
-                "current_version": None
-            }
+        # 预取时多个工作线程会同时更新配置，读取-修改-保存需在配置锁内完成
+        with self.config_manager.lock:
+            config = self.config_manager.get_config()
+            tool_cfg = config.setdefault("tools", {}).setdefault(
+                tool, {"installed_versions": [], "current_version": None}
+            )
         
-        existing = config["tools"][tool].get("installed_versions", [])
-        existing_paths = {v.get("path"): v for v in existing}
+            existing = tool_cfg.get("installed_versions", [])
+            existing_paths = {v.get("path"): v for v in existing}
         
-        updated_versions = []
-        for v in versions:
-            path = v["path"]
-            if path in existing_paths:
-                existing_v = existing_paths[path]
-                existing_v["version"] = v["version"]
-                existing_v["install_date"] = v["install_date"]
-                updated_versions.append(existing_v)
-            else:
-                v["locked"] = v.get("locked", False)
-                v["is_system"] = v.get("is_system", False)
-                updated_versions.append(v)
+            updated_versions = []
+            for v in versions:
+                path = v["path"]
+                if path in existing_paths:
+                    existing_v = existing_paths[path]
+                    existing_v["version"] = v["version"]
+                    existing_v["install_date"] = v["install_date"]
+                    updated_versions.append(existing_v)
+                else:
+                    v["locked"] = v.get("locked", False)
+                    v["is_system"] = v.get("is_system", False)
+                    updated_versions.append(v)
         
-        config["tools"][tool]["installed_versions"] = updated_versions
+            tool_cfg["installed_versions"] = updated_versions
         
-        current_version = config["tools"][tool].get("current_version")
-        if current_version:
-            for v in updated_versions:
-                if v.get("path") and current_version.startswith(v.get("path", "")):
-                    new_version = v.get("version")
-                    if new_version and new_version != current_version:
-                        logger.info(f"当前版本 {current_version} 路径对应的新版本为 {new_version}，更新 current_version")
-                        config["tools"][tool]["current_version"] = new_version
-                        break
+            current_version = tool_cfg.get("current_version")
+            if current_version:
+                for v in updated_versions:
+                    if v.get("path") and current_version.startswith(v.get("path", "")):
+                        new_version = v.get("version")
+                        if new_version and new_version != current_version:
+                            logger.info(f"当前版本 {current_version} 路径对应的新版本为 {new_version}，更新 current_version")
+                            tool_cfg["current_version"] = new_version
+                            break
         
-        self.config_manager.save_config(config)
+            self.config_manager.save_config(config)
     
     def _validate_tool_installation(self, tool: str, path: str) -> bool:
         """
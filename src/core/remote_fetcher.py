@@ -6,12 +6,14 @@
 
 import re
 import platform
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import requests
 
 from src.utils.logger import get_logger
-from src.core.config_manager import ConfigManager
+from src.core.config_manager import ConfigManager, ConfigSaveError
 from src.utils.rate_limiter import RateLimiter
 from src.core.interfaces import IRemoteFetcher
 
@@ -40,8 +42,13 @@ class MirrorStatus:
     记录镜像源的可用状态、失败时间和原因。
     """
     
+    FAILURE_THRESHOLD = 3
+    BASE_COOLDOWN_SECONDS = 15
+    MAX_COOLDOWN_SECONDS = 600
+    
     def __init__(self):
         self._status: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
     
     def record_success(self, mirror_url: str) -> None:
         """
@@ -50,12 +57,14 @@ class MirrorStatus:
         参数:
             mirror_url: 镜像源 URL
         """
-        self._status[mirror_url] = {
+        record = {
             "last_success": datetime.now(),
             "last_failure": None,
             "failure_reason": None,
             "consecutive_failures": 0
         }
+        with self._lock:
+            self._status[mirror_url] = record
     
     def record_failure(self, mirror_url: str, reason: str) -> None:
         """
@@ -65,16 +74,17 @@ class MirrorStatus:
             mirror_url: 镜像源 URL
             reason: 失败原因
         """
-        current = self._status.get(mirror_url, {
-            "last_success": None,
-            "last_failure": None,
-            "failure_reason": None,
-            "consecutive_failures": 0
-        })
-        current["last_failure"] = datetime.now()
-        current["failure_reason"] = reason
-        current["consecutive_failures"] = current.get("consecutive_failures", 0) + 1
-        self._status[mirror_url] = current
+        with self._lock:
+            current = dict(self._status.get(mirror_url, {
+                "last_success": None,
+                "last_failure": None,
+                "failure_reason": None,
+                "consecutive_failures": 0
+            }))
+            current["last_failure"] = datetime.now()
+            current["failure_reason"] = reason
+            current["consecutive_failures"] = current.get("consecutive_failures", 0) + 1
+            self._status[mirror_url] = current
     
     def get_sorted_mirrors(self, mirror_list: List[str]) -> List[str]:
         """
@@ -100,6 +110,46 @@ class MirrorStatus:
         
         return sorted(mirror_list, key=get_priority)
     
+    def cooldown_seconds(self, consecutive_failures: int) -> float:
+        """
+        计算镜像源连续失败后的冷却时间。
+        
+        冷却时间随连续失败次数指数增长，并以 MAX_COOLDOWN_SECONDS 为上限。
+        
+        参数:
+            consecutive_failures: 连续失败次数
+            
+        返回:
+            冷却时间（秒），未达到失败阈值时返回 0
+        """
+        if consecutive_failures < self.FAILURE_THRESHOLD:
+            return 0
+        exponent = consecutive_failures - self.FAILURE_THRESHOLD
+        return min(self.MAX_COOLDOWN_SECONDS, self.BASE_COOLDOWN_SECONDS * 2 ** exponent)
+    
+    def filter_available(self, mirror_list: List[str]) -> List[str]:
+        """
+        过滤掉仍处于冷却期的镜像源。
+        
+        连续失败达到阈值且距最近一次失败未超过冷却时间的镜像源将被跳过。
+        
+        参数:
+            mirror_list: 镜像源列表
+            
+        返回:
+            可用的镜像源列表
+        """
+        now = datetime.now()
+        available = []
+        for mirror_url in mirror_list:
+            status = self._status.get(mirror_url, {})
+            last_failure = status.get("last_failure")
+            cooldown = self.cooldown_seconds(status.get("consecutive_failures", 0))
+            if cooldown and last_failure and (now - last_failure).total_seconds() < cooldown:
+                continue
+            available.append(mirror_url)
+        return available
+    
     def get_failure_summary(self) -> str:
         """
         获取失败摘要信息。
@@ -107,14 +157,62 @@ class MirrorStatus:
         返回:
             失败摘要字符串
         """
+        with self._lock:
+            items = list(self._status.items())
         summaries = []
-        for mirror_url, status in self._status.items():
+        for mirror_url, status in items:
             if status.get("last_failure"):
                 summaries.append(
                     f"{mirror_url}: {status.get('failure_reason', '未知错误')} "
                     f"(连续失败 {status.get('consecutive_failures', 0)} 次)"
                 )
         return "; ".join(summaries) if summaries else "无失败记录"
+    
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        将镜像源状态序列化为可写入 JSON 的字典。
+        
+        返回:
+            镜像源 URL 到状态字典的映射，时间字段转换为 ISO 格式字符串
+        """
+        with self._lock:
+            items = list(self._status.items())
+        result = {}
+        for mirror_url, status in items:
+            record = dict(status)
+            for field in ("last_success", "last_failure"):
+                value = record.get(field)
+                record[field] = value.isoformat() if value else None
+            result[mirror_url] = record
+        return result
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, dict[str, Any]]) -> "MirrorStatus":
+        """
+        从序列化的字典恢复镜像源状态。
+        
+        参数:
+            data: to_dict() 生成的字典
+            
+        返回:
+            MirrorStatus 实例，无法解析的记录将被忽略
+        """
+        instance = cls()
+        if not isinstance(data, dict):
+            return instance
+        for mirror_url, status in data.items():
+            if not isinstance(status, dict):
+                continue
+            try:
+                record = dict(status)
+                for field in ("last_success", "last_failure"):
+                    value = record.get(field)
+                    record[field] = datetime.fromisoformat(value) if value else None
+                record["consecutive_failures"] = int(record.get("consecutive_failures", 0))
+                instance._status[mirror_url] = record
+            except (TypeError, ValueError) as e:
+                logger.debug(f"忽略无效的镜像源状态记录 {mirror_url}: {e}")
+        return instance
 
 
 class RemoteFetcher(IRemoteFetcher):
@@ -135,8 +233,47 @@ class RemoteFetcher(IRemoteFetcher):
         self.config_manager = config_manager
         rate_limit = config_manager.get_request_rate_limit()
         self.rate_limiter = RateLimiter(requests_per_second=rate_limit)
-        self._memory_cache: dict[str, dict[str, Any]] = {}
-        self.mirror_status = MirrorStatus()
+        self._memory_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._memory_cache_cap = 64
+        self._memory_cache_lock = threading.Lock()
+        self.mirror_status = MirrorStatus.from_dict(
+            self.config_manager.get_cache().get("mirror_status", {})
+        )
+    
+    def _mc_get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        从内存缓存读取条目，命中时将其标记为最近使用。
+        
+        参数:
+            key: 缓存键名
+            
+        返回:
+            缓存条目，未命中返回 None
+        """
+        with self._memory_cache_lock:
+            value = self._memory_cache.get(key)
+            if value is not None:
+                self._memory_cache.move_to_end(key)
+            return value
+    
+    def _mc_set(self, key: str, value: dict[str, Any]) -> None:
+        """
+        写入内存缓存，超出容量时淘汰最久未使用的条目。
+        
+        参数:
+            key: 缓存键名
+            value: 缓存条目
+        """
+        with self._memory_cache_lock:
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self._memory_cache_cap:
+                self._memory_cache.popitem(last=False)
+    
+    def clear_memory_cache(self) -> None:
+        """清空内存缓存，之后的查询将重新读取持久化缓存或访问网络。"""
+        with self._memory_cache_lock:
+            self._memory_cache.clear()
     
     def get_mirror_list(self, tool: str) -> List[str]:
         """
@@ -180,8 +317,8 @@ class RemoteFetcher(IRemoteFetcher):
         cache_key = f"{tool}_versions"
         cache_expire_time = self.config_manager.get_cache_expire_time()
         
-        if use_cache and cache_key in self._memory_cache:
-            cached = self._memory_cache[cache_key]
+        cached = self._mc_get(cache_key) if use_cache else None
+        if cached is not None:
             last_update = datetime.fromisoformat(cached.get("last_update", "2000-01-01"))
             if (datetime.now() - last_update).total_seconds() < cache_expire_time:
                 logger.info(f"使用内存缓存的 {tool} 版本信息")
@@ -193,7 +330,7 @@ class RemoteFetcher(IRemoteFetcher):
             last_update = datetime.fromisoformat(cached.get("last_update", "2000-01-01"))
             if (datetime.now() - last_update).total_seconds() < cache_expire_time:
                 logger.info(f"使用本地缓存的 {tool} 版本信息")
-                self._memory_cache[cache_key] = cached
+                self._mc_set(cache_key, cached)
                 return cached.get("versions", [])
         
         mirror_list = self.get_mirror_list(tool)
@@ -201,11 +338,16 @@ class RemoteFetcher(IRemoteFetcher):
             logger.warning(f"未配置 {tool} 的镜像 URL")
             if use_cache and cache_key in cache:
                 logger.info(f"网络错误，使用缓存的 {tool} 版本信息")
-                self._memory_cache[cache_key] = cache[cache_key]
+                self._mc_set(cache_key, cache[cache_key])
                 return cache[cache_key].get("versions", [])
             return []
         
         sorted_mirrors = self.mirror_status.get_sorted_mirrors(mirror_list)
+        available_mirrors = self.mirror_status.filter_available(sorted_mirrors)
+        if available_mirrors:
+            sorted_mirrors = available_mirrors
+        else:
+            logger.info(f"{tool} 的所有镜像源均处于冷却期，仍尝试全部镜像源")
         errors = []
         
         for mirror_url in sorted_mirrors:
@@ -220,18 +362,10 @@ class RemoteFetcher(IRemoteFetcher):
                     errors.append(f"{mirror_url}: {error_msg}")
                     continue
                 
-                validated_versions = self._validate_version_list(versions, tool, mirror_url)
-                if not validated_versions:
-                    error_msg = f"版本列表验证失败，无有效版本"
-                    logger.warning(f"从镜像源 {mirror_url} 获取 {tool} 版本失败: {error_msg}")
-                    self.mirror_status.record_failure(mirror_url, error_msg)
-                    errors.append(f"{mirror_url}: {error_msg}")
-                    continue
-                
                 self.mirror_status.record_success(mirror_url)
-                self._update_cache(tool, validated_versions)
-                logger.info(f"成功从镜像源 {mirror_url} 获取 {len(validated_versions)} 个 {tool} 版本")
-                return validated_versions
+                self._update_cache(tool, versions)
+                logger.info(f"成功从镜像源 {mirror_url} 获取 {len(versions)} 个 {tool} 版本")
+                return versions
             except Exception as e:
                 error_msg = str(e)
                 logger.warning(f"从镜像源 {mirror_url} 获取 {tool} 版本失败: {error_msg}")
@@ -241,43 +375,14 @@ class RemoteFetcher(IRemoteFetcher):
         
         failure_summary = self.mirror_status.get_failure_summary()
         logger.error(f"所有镜像源获取 {tool} 版本失败。失败详情: {failure_summary}")
+        self.persist()
         
         if use_cache and cache_key in cache:
             logger.info(f"网络错误，使用缓存的 {tool} 版本信息")
-            self._memory_cache[cache_key] = cache[cache_key]
+            self._mc_set(cache_key, cache[cache_key])
             return cache[cache_key].get("versions", [])
         return []
     
-    def _validate_version_list(self, versions: List[Dict[str, Any]], tool: str, mirror_url: str) -> List[Dict[str, Any]]:
-        """
-        验证版本列表的有效性。
-        
-        参数:
-            versions: 版本列表
-            tool: 工具名称
-            mirror_url: 镜像源 URL
-            
-        返回:
-            验证后的有效版本列表
-        """
-        validated = []
-        for v in versions:
-            if not isinstance(v, dict):
-                continue
-            if "version" not in v:
-                continue
-            if "download_url" not in v or not v["download_url"]:
-                continue
-            validated.append(v)
-        
-        if len(validated) != len(versions):
-            logger.warning(
-                f"镜像源 {mirror_url} 返回的 {tool} 版本列表中 "
-                f"有 {len(versions) - len(validated)} 个无效项被过滤"
-            )
-        
-        return validated
-    
     def _fetch_versions_from_mirror(self, tool: str, mirror_url: str) -> List[Dict[str, Any]]:
         """
         从镜像源获取版本列表。
@@ -433,6 +538,8 @@ class RemoteFetcher(IRemoteFetcher):
                 version_info = self._build_version_info(
                     version, mirror_url, download_url_template, arch, arch_map, item
                 )
+                if not version_info["download_url"]:
+                    continue
                 
                 if lts_field and lts_field in item:
                     version_info["lts"] = bool(item[lts_field])
@@ -489,6 +596,8 @@ class RemoteFetcher(IRemoteFetcher):
                 version_info = self._build_version_info(
                     version, mirror_url, download_url_template, arch, arch_map, None
                 )
+                if not version_info["download_url"]:
+                    continue
                 versions.append(version_info)
                 
         except Exception as e:
@@ -624,7 +733,11 @@ class RemoteFetcher(IRemoteFetcher):
             response.raise_for_status()
             data = response.json()
             for item in data:
+                if not isinstance(item, dict):
+                    continue
                 version = item.get("version", "").lstrip("v")
+                if not version:
+                    continue
                 arch = "x64" if platform.machine().endswith('64') else "x86"
                 download_url = f"{mirror_url}v{version}/node-v{version}-win-{arch}.zip"
                 lts = item.get("lts", False)
@@ -744,6 +857,20 @@ class RemoteFetcher(IRemoteFetcher):
             "last_update": datetime.now().isoformat(),
             "versions": versions
         }
-        self._memory_cache[cache_key] = cache_data
-        self.config_manager.set_cache(cache_key, cache_data)
-        self.config_manager.save_cache()
+        self._mc_set(cache_key, cache_data)
+        self.config_manager.update_cache({
+            cache_key: cache_data,
+            "mirror_status": self.mirror_status.to_dict(),
+        })
+    
+    def persist(self) -> None:
+        """
+        将镜像源状态写入缓存文件，下次启动时用于镜像源排序。
+        
+        在所有镜像源均失败、下载结束及程序退出时调用，
+        使仅记录了失败的镜像源状态也能保存下来。
+        """
+        try:
+            self.config_manager.update_cache({"mirror_status": self.mirror_status.to_dict()})
+        except ConfigSaveError as e:
+            logger.warning(f"保存镜像源状态失败: {e}")
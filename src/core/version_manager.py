@@ -5,15 +5,19 @@
 """
 
 import os
-import re
 import shutil
+import time
+import uuid
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 
 from src.utils.logger import get_logger
 from src.core.config_manager import ConfigManager
 from src.core.env_manager import EnvManager
-from src.core.remote_fetcher import RemoteFetcher, MirrorStatus
+from src.core.remote_fetcher import RemoteFetcher
 from src.core.local_manager import LocalManager
 from src.core.download_manager import DownloadManager
 from src.core import version_utils
@@ -23,6 +27,29 @@ from src.utils.input_validator import InputValidator, InputValidationError
 logger = get_logger()
 
 
+TRASH_DIR_NAME = ".mysysenv_trash"
+
+_trash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mysysenv-trash")
+
+
+@lru_cache(maxsize=256)
+def _cached_validate(tool: str, version: str) -> None:
+    """
+    验证工具名称和版本号，缓存验证通过的组合。
+    
+    验证失败时抛出的异常不会被缓存。
+    
+    参数:
+        tool: 工具名称
+        version: 版本号
+        
+    抛出:
+        InputValidationError: 参数验证失败时抛出
+    """
+    InputValidator.validate_tool_name(tool)
+    InputValidator.validate_version_string(version)
+
+
 class VersionManagerError(Exception):
     """版本管理错误异常。"""
     pass
@@ -59,6 +86,8 @@ class VersionManager(IVersionManager):
     实现 IVersionManager 抽象接口。
     """
     
+    _CACHE_TTL_S = 60
+    
     def __init__(self, config_manager: ConfigManager, env_manager: EnvManager):
         """
         初始化版本管理器。
@@ -76,6 +105,98 @@ class VersionManager(IVersionManager):
         
         self.mirror_status = self.remote_fetcher.mirror_status
         self._memory_cache: Dict[str, Any] = {}
+        self._last_scan_mtime: Dict[str, float] = {}
+        self._load_persisted_versions()
+        self._sweep_trash()
+    
+    def _load_persisted_versions(self) -> None:
+        """
+        从持久化缓存中预载仍在有效期内的远程版本列表到内存缓存。
+        
+        远程版本列表由 RemoteFetcher 写入 cache.json，这里直接复用，
+        避免重启后的首次查询再次解析缓存或访问网络。
+        """
+        expire_time = self.config_manager.get_cache_expire_time()
+        now = datetime.now()
+        for cache_key, cached in self.config_manager.get_cache().items():
+            if not cache_key.endswith("_versions") or not isinstance(cached, dict):
+                continue
+            versions = cached.get("versions")
+            if not versions:
+                continue
+            try:
+                last_update = datetime.fromisoformat(cached.get("last_update", ""))
+            except (TypeError, ValueError):
+                continue
+            remaining = expire_time - (now - last_update).total_seconds()
+            if remaining > 0:
+                # 按持久化数据的剩余有效期回推时间戳，即将过期的数据不会重新获得完整的内存缓存期
+                ts = time.monotonic() - max(0.0, self._CACHE_TTL_S - remaining)
+                self._cache_remote_versions(cache_key, versions, ts)
+    
+    def clear_memory_cache(self) -> None:
+        """
+        清空版本管理器及远程获取器的内存缓存。
+        
+        持久化缓存被清除后调用，避免内存中的旧版本列表在有效期内继续被返回。
+        """
+        self._memory_cache.clear()
+        self._last_scan_mtime.clear()
+        self.remote_fetcher.clear_memory_cache()
+    
+    def _cache_remote_versions(
+        self,
+        cache_key: str,
+        versions: List[Dict[str, Any]],
+        ts: Optional[float] = None
+    ) -> None:
+        """
+        写入远程版本内存缓存，同时建立按版本号的索引。
+        
+        列表在写入时排序一次，之后的排序和分组可直接复用排序结果。
+        
+        参数:
+            cache_key: 缓存键名
+            versions: 远程版本信息列表
+            ts: 缓存时间戳（time.monotonic()），默认为当前时间
+        """
+        versions = version_utils.sort_versions_desc(versions)
+        self._memory_cache[cache_key] = {
+            "versions": versions,
+            "by_version": {v.get("version"): v for v in versions},
+            "ts": time.monotonic() if ts is None else ts
+        }
+    
+    def _sweep_trash(self) -> None:
+        """清理上次运行遗留在各工具根目录回收站中的目录。"""
+        for tool in self.config_manager.get_tool_templates():
+            root_path = self.config_manager.get_normalized_tool_root(tool)
+            if not root_path:
+                continue
+            trash_dir = Path(root_path) / TRASH_DIR_NAME
+            if trash_dir.is_dir():
+                logger.debug(f"清理遗留的回收站目录: {trash_dir}")
+                _trash_executor.submit(shutil.rmtree, trash_dir, ignore_errors=True)
+    
+    def _remove_tree(self, path: str) -> None:
+        """
+        删除版本目录。
+        
+        先将目录重命名到同级回收站目录中，再在后台线程中真正删除；
+        重命名失败时回退为同步删除。
+        
+        参数:
+            path: 要删除的目录路径
+        """
+        trash = Path(path).parent / TRASH_DIR_NAME / uuid.uuid4().hex
+        try:
+            trash.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, trash)
+        except OSError as e:
+            logger.debug(f"移动 {path} 到回收站失败，改为直接删除: {e}")
+            shutil.rmtree(path)
+            return
+        _trash_executor.submit(shutil.rmtree, trash, ignore_errors=True)
     
     def get_tool_version_by_cmd(self, tool: str, tool_path: str) -> Optional[str]:
         """
@@ -90,6 +211,24 @@ class VersionManager(IVersionManager):
         """
         return self.local_manager.get_tool_version_by_cmd(tool, tool_path)
     
+    def _get_tool_root_mtime(self, tool: str) -> Optional[float]:
+        """
+        获取工具根目录的修改时间。
+        
+        参数:
+            tool: 工具名称
+            
+        返回:
+            修改时间戳，根目录未配置或不存在返回 None
+        """
+        root_path = self.config_manager.get_normalized_tool_root(tool)
+        if not root_path:
+            return None
+        try:
+            return os.stat(root_path).st_mtime
+        except OSError:
+            return None
+    
     def scan_local_versions(self, tool: str) -> List[Dict[str, Any]]:
         """
         扫描本地已安装的工具版本。
@@ -100,7 +239,26 @@ class VersionManager(IVersionManager):
         返回:
             版本信息列表，每个元素包含 version、path、install_date
         """
-        return self.local_manager.scan_local_versions(tool)
+        cache_key = f"{tool}_local_versions"
+        root_mtime = self._get_tool_root_mtime(tool)
+        
+        # 只缓存目录扫描结果；锁定/系统状态来自配置，每次调用都重新计算
+        cached = self._memory_cache.get(cache_key)
+        if cached and root_mtime is not None and cached.get("mtime") == root_mtime:
+            entries = cached["entries"]
+        else:
+            entries = self.local_manager.scan_version_dirs(tool)
+            if entries is None:
+                self._memory_cache.pop(cache_key, None)
+                return []
+            if root_mtime is not None:
+                self._last_scan_mtime[tool] = root_mtime
+                self._memory_cache[cache_key] = {
+                    "entries": entries,
+                    "ts": time.monotonic(),
+                    "mtime": root_mtime
+                }
+        return self.local_manager.apply_installed_state(tool, entries)
     
     def get_remote_versions(self, tool: str, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
@@ -113,7 +271,42 @@ class VersionManager(IVersionManager):
         返回:
             远程版本信息列表
         """
-        return self.remote_fetcher.get_remote_versions(tool, use_cache)
+        cache_key = f"{tool}_versions"
+        if use_cache:
+            cached = self._memory_cache.get(cache_key)
+            if cached and time.monotonic() - cached["ts"] < self._CACHE_TTL_S:
+                return cached["versions"]
+        
+        versions = self.remote_fetcher.get_remote_versions(tool, use_cache)
+        if versions:
+            self._cache_remote_versions(cache_key, versions)
+            return self._memory_cache[cache_key]["versions"]
+        return versions
+    
+    def prefetch_all(self, tools: List[str]) -> None:
+        """
+        并发预取所有工具的本地版本和远程版本，结果由各自的缓存保存。
+        
+        参数:
+            tools: 工具名称列表
+        """
+        if not tools:
+            return
+        
+        logger.info(f"开始预取 {len(tools)} 个工具的版本信息")
+        with ThreadPoolExecutor(max_workers=min(16, 2 * len(tools))) as executor:
+            futures = {}
+            for tool in tools:
+                futures[executor.submit(self.scan_local_versions, tool)] = (tool, "local")
+                futures[executor.submit(self.get_remote_versions, tool)] = (tool, "remote")
+            
+            for future in as_completed(futures):
+                tool, kind = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"预取 {tool} 的{'本地' if kind == 'local' else '远程'}版本失败: {e}")
+        logger.info("版本信息预取完成")
     
     def get_version_info(self, tool: str, version: str) -> Optional[Dict[str, Any]]:
         """
@@ -127,17 +320,20 @@ class VersionManager(IVersionManager):
             版本信息字典，未找到返回 None
         """
         cache_key = f"{tool}_versions"
-        if cache_key in self._memory_cache:
-            cached = self._memory_cache[cache_key]
-            for v in cached.get("versions", []):
-                if v.get("version") == version:
-                    return v
+        cached = self._memory_cache.get(cache_key)
+        if cached and time.monotonic() - cached["ts"] < self._CACHE_TTL_S:
+            version_info = cached["by_version"].get(version)
+            if version_info:
+                return version_info
         
         versions = self.get_remote_versions(tool, use_cache=True)
-        for v in versions:
-            if v.get("version") == version:
-                return v
-        return None
+        if not versions:
+            return None
+        cached = self._memory_cache.get(cache_key)
+        if not cached or cached["versions"] is not versions:
+            self._cache_remote_versions(cache_key, versions)
+            cached = self._memory_cache[cache_key]
+        return cached["by_version"].get(version)
     
     def sort_versions_desc(self, versions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -185,10 +381,27 @@ class VersionManager(IVersionManager):
             成功返回 True，失败返回 False
         """
         mirror_list = self.remote_fetcher.get_mirror_list(tool)
-        return self.download_manager.download_version(
+        success = self.download_manager.download_version(
             tool, version, progress_callback, status_callback, version_info,
             self.mirror_status, mirror_list
         )
+        self.remote_fetcher.persist()
+        if success:
+            self._memory_cache.pop(f"{tool}_versions", None)
+        return success
+    
+    @staticmethod
+    def _index_installed(installed: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        按版本号建立已安装版本的索引。
+        
+        参数:
+            installed: 已安装版本信息列表
+            
+        返回:
+            版本号到版本信息的映射字典
+        """
+        return {v["version"]: v for v in installed}
     
     def switch_version(self, tool: str, version: str) -> bool:
         """
@@ -203,8 +416,7 @@ class VersionManager(IVersionManager):
         """
         try:
             try:
-                InputValidator.validate_tool_name(tool)
-                InputValidator.validate_version_string(version)
+                _cached_validate(tool, version)
             except InputValidationError as e:
                 logger.error(f"参数验证失败: {e}")
                 return False
@@ -215,13 +427,16 @@ class VersionManager(IVersionManager):
                 
             logger.info(f"正在切换 {tool} 到版本 {version}")
             config = self.config_manager.get_config()
-            tools_config = config.get("tools", {}).get(tool, {})
-            installed = tools_config.get("installed_versions", [])
-            version_info = next((v for v in installed if v["version"] == version), None)
+            # 切换成功前只读取配置，避免未知工具或未安装版本在配置中留下空条目
+            tool_cfg = config.get("tools", {}).get(tool) or {}
+            installed_index = self._index_installed(tool_cfg.get("installed_versions", []))
+            version_info = installed_index.get(version)
             
             if not version_info:
-                local_versions = self.scan_local_versions(tool)
-                version_info = next((v for v in local_versions if v["version"] == version), None)
+                root_mtime = self._get_tool_root_mtime(tool)
+                if root_mtime is None or root_mtime > self._last_scan_mtime.get(tool, 0):
+                    local_versions = self.scan_local_versions(tool)
+                    version_info = self._index_installed(local_versions).get(version)
                 if not version_info:
                     error_msg = f"{tool} 版本 {version} 未安装"
                     logger.error(error_msg)
@@ -240,19 +455,20 @@ class VersionManager(IVersionManager):
                 logger.error(f"设置 {tool} {version} 环境变量失败")
                 return False
                 
-            if "tools" not in config:
-                config["tools"] = {}
-            if tool not in config["tools"]:
-                config["tools"][tool] = {"installed_versions": [], "current_version": None}
-                
-            current_version = tools_config.get("current_version")
+            tool_cfg = config.setdefault("tools", {}).setdefault(
+                tool, {"installed_versions": [], "current_version": None}
+            )
+            installed = tool_cfg.setdefault("installed_versions", [])
+            installed_index = self._index_installed(installed)
+            current_version = tool_cfg.get("current_version")
             if current_version:
-                current_info = next((v for v in installed if v["version"] == current_version), None)
+                current_info = installed_index.get(current_version)
                 if current_info:
                     current_info["is_system"] = False
-                    
-            version_info["is_system"] = True
-            config["tools"][tool]["current_version"] = version
+            
+            # 扫描结果返回的是新字典，扫描后已同步到配置，这里更新配置中的对应条目
+            installed_index.get(version, version_info)["is_system"] = True
+            tool_cfg["current_version"] = version
             self.config_manager.save_config(config)
             logger.info(f"已切换 {tool} 到版本 {version}")
             return True
@@ -261,6 +477,19 @@ class VersionManager(IVersionManager):
             logger.error(f"切换 {tool} 到版本 {version} 时发生错误: {e}")
             return False
     
+    def switch_many(self, pairs: List[tuple]) -> List[bool]:
+        """
+        批量切换多个工具的版本，所有切换完成后只保存一次配置。
+        
+        参数:
+            pairs: (工具名称, 版本号) 元组列表
+            
+        返回:
+            与输入顺序对应的切换结果列表
+        """
+        with self.config_manager.batch():
+            return [self.switch_version(tool, version) for tool, version in pairs]
+    
     def get_current_version(self, tool: str) -> Optional[str]:
         """
         获取当前使用的版本。
@@ -293,16 +522,15 @@ class VersionManager(IVersionManager):
             成功返回 True，失败返回 False
         """
         try:
-            InputValidator.validate_tool_name(tool)
-            InputValidator.validate_version_string(version)
+            _cached_validate(tool, version)
         except InputValidationError as e:
             logger.error(f"参数验证失败: {e}")
             return False
             
         config = self.config_manager.get_config()
-        tools_config = config.get("tools", {}).get(tool, {})
-        installed = tools_config.get("installed_versions", [])
-        version_info = next((v for v in installed if v["version"] == version), None)
+        tool_cfg = config.get("tools", {}).get(tool, {})
+        installed = tool_cfg.get("installed_versions", [])
+        version_info = self._index_installed(installed).get(version)
         if not version_info:
             logger.error(f"未找到 {tool} 版本 {version}")
             return False
@@ -324,16 +552,15 @@ class VersionManager(IVersionManager):
             成功返回 True，失败返回 False
         """
         try:
-            InputValidator.validate_tool_name(tool)
-            InputValidator.validate_version_string(version)
+            _cached_validate(tool, version)
         except InputValidationError as e:
             logger.error(f"参数验证失败: {e}")
             return False
             
         config = self.config_manager.get_config()
-        tools_config = config.get("tools", {}).get(tool, {})
-        installed = tools_config.get("installed_versions", [])
-        version_info = next((v for v in installed if v["version"] == version), None)
+        tool_cfg = config.get("tools", {}).get(tool, {})
+        installed = tool_cfg.get("installed_versions", [])
+        version_info = self._index_installed(installed).get(version)
         if not version_info:
             logger.error(f"未找到 {tool} 版本 {version}")
             return False
@@ -346,11 +573,11 @@ class VersionManager(IVersionManager):
         path = version_info["path"]
         try:
             if os.path.exists(path):
-                shutil.rmtree(path)
+                self._remove_tree(path)
                 logger.info(f"已删除 {path}")
             installed.remove(version_info)
-            if tools_config.get("current_version") == version:
-                config["tools"][tool]["current_version"] = None
+            if tool_cfg.get("current_version") == version:
+                tool_cfg["current_version"] = None
             self.config_manager.save_config(config)
             return True
         except Exception as e:
@@ -5,9 +5,15 @@
 """
 
 import re
+from functools import lru_cache
+from itertools import pairwise
 from typing import List, Dict, Any
 
+_DIGIT_RE = re.compile(r'\d+')
+_VERSION_KEY_WIDTH = 6
 
+
+@lru_cache(maxsize=2048)
 def _parse_version(version_str: str) -> tuple:
     """
     解析版本字符串为可比较的元组。
@@ -16,10 +22,33 @@ def _parse_version(version_str: str) -> tuple:
         version_str: 版本字符串
         
     返回:
-        版本元组 (major, minor, patch, ...)
+        定长版本元组 (major, minor, patch, ...)，不足部分补 0
     """
-    parts = re.findall(r'\d+', version_str)
-    return tuple(int(p) for p in parts) if parts else (0,)
+    parts = _DIGIT_RE.findall(version_str)
+    nums = tuple(int(p) for p in parts[:_VERSION_KEY_WIDTH])
+    return nums + (0,) * (_VERSION_KEY_WIDTH - len(nums))
+
+
+def _sort_with_keys(versions: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    按版本号降序排列，并保留每项解析出的版本元组。
+    
+    每个版本字符串只解析一次，相同版本保持原有顺序。
+    已是降序的列表（如缓存中的版本列表）只做一次线性检查，不再排序。
+    
+    参数:
+        versions: 版本信息列表
+        
+    返回:
+        排序后的 (版本元组, 版本信息) 列表
+    """
+    keyed = [(_parse_version(v.get("version", "0")), v) for v in versions]
+    if all(a[0] >= b[0] for a, b in pairwise(keyed)):
+        return keyed
+    
+    decorated = [(key, -i, v) for i, (key, v) in enumerate(keyed)]
+    decorated.sort(reverse=True)
+    return [(key, v) for key, _, v in decorated]
 
 
 def sort_versions_desc(versions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -32,11 +61,7 @@ def sort_versions_desc(versions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     返回:
         排序后的版本列表
     """
-    return sorted(
-        versions,
-        key=lambda v: _parse_version(v.get("version", "0")),
-        reverse=True
-    )
+    return [v for _, v in _sort_with_keys(versions)]
 
 
 def group_versions_by_major(versions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -49,26 +74,17 @@ def group_versions_by_major(versions: List[Dict[str, Any]]) -> List[Dict[str, An
     返回:
         分组后的版本列表，每个分组包含 major_version 和 versions
     """
-    sorted_versions = sort_versions_desc(versions)
     groups = {}
     
-    for v in sorted_versions:
-        version_str = v.get("version", "0")
-        parts = version_str.split(".")
-        major = parts[0] if parts else "0"
-        
-        if major not in groups:
-            groups[major] = {
-                "major_version": major,
-                "versions": [],
-                "has_lts": False
-            }
-        
-        groups[major]["versions"].append(v)
+    for key, v in _sort_with_keys(versions):
+        major = key[0] if key else 0
+        group = groups.setdefault(
+            major,
+            {"major_version": str(major), "versions": [], "has_lts": False}
+        )
+        group["versions"].append(v)
         if v.get("lts"):
-            groups[major]["has_lts"] = True
-    
-    result = list(groups.values())
-    result.sort(key=lambda g: int(g["major_version"]) if g["major_version"].isdigit() else 0, reverse=True)
+            group["has_lts"] = True
     
-    return result
+    # 版本已按降序排列，分组按插入顺序即为主版本号降序
+    return list(groups.values())
@@ -20,10 +20,14 @@ def setup_import_path() -> None:
 
 setup_import_path()
 
-from src.cli import create_parser, run_cli
-from src.ui import run_gui
+from src.cli import create_parser
 from src.utils.permission_manager import is_admin, run_as_admin
 
+if sys.platform == "win32":
+    _MessageBoxW = ctypes.windll.user32.MessageBoxW
+    _MessageBoxW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint]
+    _MessageBoxW.restype = ctypes.c_int
+
 
 def show_admin_confirm_dialog() -> bool:
     """
@@ -37,7 +41,7 @@ def show_admin_confirm_dialog() -> bool:
     IDYES = 6
     IDNO = 7
 
-    result = ctypes.windll.user32.MessageBoxW(
+    result = _MessageBoxW(
         None,
         "此程序需要管理员权限才能正常运行某些功能。\n\n是否现在获取管理员权限？",
         "管理员权限请求",
@@ -57,7 +61,7 @@ def main(args: Optional[list[str]] = None) -> int:
     返回:
         退出码（0 表示成功，非零表示错误）。
     """
-    if not is_admin() and sys.platform == "win32":
+    if sys.platform == "win32" and not is_admin():
         if show_admin_confirm_dialog():
             run_as_admin()
             sys.exit(0)
@@ -66,8 +70,10 @@ def main(args: Optional[list[str]] = None) -> int:
     parsed_args = parser.parse_args(args)
     
     if parsed_args.command:
+        from src.cli import run_cli
         return run_cli(parsed_args)
     else:
+        from src.ui import run_gui
         return run_gui(parsed_args)
 
 
@@ -5,12 +5,14 @@
 使用 ViewModel 模式，将具体工作委托给各个专用 ViewModel。
 """
 
+import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from PySide6.QtCore import QObject, Signal, Property, Slot, QUrl
+from typing import Dict, Optional, Tuple
+from PySide6.QtCore import QObject, Signal, Property, Slot, QUrl, QTimer
 from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QGuiApplication
 
 from src.core.config_manager import ConfigManager
 from src.core.env_manager import EnvManager
@@ -27,6 +29,35 @@ from src.ui.viewmodels import (
 logger = get_logger()
 
 
+@lru_cache(maxsize=256)
+def _normalize_tool_name(tool_name: str) -> str:
+    """
+    规范化工具名称（去除首尾空白并转为小写），结果经驻留后缓存。
+    
+    参数:
+        tool_name: 原始工具名称
+        
+    返回:
+        规范化后的工具名称
+    """
+    return sys.intern(tool_name.strip().lower())
+
+
+@lru_cache(maxsize=1)
+def _create_managers() -> Tuple[ConfigManager, EnvManager, VersionManager]:
+    """
+    创建并缓存核心管理器实例，供所有 Backend 实例共享。
+    
+    返回:
+        (配置管理器, 环境变量管理器, 版本管理器) 元组
+    """
+    config_manager = ConfigManager()
+    env_manager = EnvManager()
+    version_manager = VersionManager(config_manager, env_manager)
+    version_manager.local_manager._version_manager = version_manager
+    return config_manager, env_manager, version_manager
+
+
 class Backend(QObject):
     """
     QML 后端类（简化版）。
@@ -34,178 +65,93 @@ class Backend(QObject):
     作为最小 UI 桥接，将具体工作委托给各个专用 ViewModel。
     """
     
-    toolsChanged = Signal()
-    currentToolChanged = Signal()
-    installedVersionsChanged = Signal()
-    remoteVersionsChanged = Signal()
-    groupedRemoteVersionsChanged = Signal()
-    currentVersionChanged = Signal()
-    messageChanged = Signal()
-    downloadProgressChanged = Signal()
-    downloadInProgressChanged = Signal()
-    configJsonChanged = Signal()
+    __slots__ = (
+        "_log",
+        "_config_manager",
+        "_env_manager",
+        "_version_manager",
+        "_tool_data",
+        "_config_data",
+        "_async_task",
+        "_logger",
+        "_is_admin",
+        "_tool_root_cache",
+    )
+
     isAdminChanged = Signal()
-    remoteVersionsLoadingChanged = Signal()
-    downloadToolNameChanged = Signal()
-    downloadingVersionChanged = Signal()
-    downloadedBytesChanged = Signal()
-    totalBytesChanged = Signal()
 
     def __init__(self, parent=None):
         """初始化后端对象。"""
         super().__init__(parent)
-        self._log = get_logger()
+        self._log = logger
         self._log.info("初始化 Backend 开始")
         
-        self._config_manager = ConfigManager()
-        self._env_manager = EnvManager()
-        self._version_manager = VersionManager(self._config_manager, self._env_manager)
+        self._config_manager, self._env_manager, self._version_manager = _create_managers()
         
         self._tool_data = ToolDataProvider(self._config_manager, self._version_manager, self)
-        self._version_manager.local_manager._version_manager = self._version_manager
         self._config_data = ConfigDataProvider(self._config_manager, self)
         self._async_task = AsyncTaskManager(self._version_manager, self)
         self._logger = LoggerBridge(self)
         
-        self._is_admin: bool = is_admin()
-        self._log.debug(f"管理员权限状态: {self._is_admin}")
+        self._is_admin: Optional[bool] = None
+        self._tool_root_cache: Dict[str, str] = {}
         
         self._connect_signals()
-        self._tool_data._load_tools()
-        if self._tool_data.tools:
-            first_tool = self._tool_data.tools[0]["name"]
-            self._tool_data.currentTool = first_tool
-            self._tool_data.load_tool_data()
+        QTimer.singleShot(0, self._bootstrap)
         self._log.info("Backend 初始化完成")
 
+    @Slot()
+    def _bootstrap(self):
+        """在事件循环启动后加载初始工具数据，避免阻塞界面首次显示。"""
+        self._log.debug("加载初始工具数据开始")
+        with self._tool_data.batch_updates():
+            self._tool_data._load_tools()
+            if self._tool_data.tools:
+                first_tool = self._tool_data.tools[0]["name"]
+                self._tool_data.currentTool = first_tool
+                self._tool_data.load_tool_data()
+        self._async_task.prefetch_all_async([t["name"] for t in self._tool_data.tools])
+        self._log.debug("初始工具数据加载完成")
+
     def _connect_signals(self):
-        """连接各个 ViewModel 的信号到本类的信号。"""
+        """连接 ViewModel 中需要后端处理的信号。
+
+        状态属性的变更信号由 QML 直接绑定到 ViewModel，无需经本类转发。
+        """
         self._log.debug("连接信号开始")
-        self._tool_data.toolsChanged.connect(self.toolsChanged)
-        self._tool_data.currentToolChanged.connect(self.currentToolChanged)
-        self._tool_data.installedVersionsChanged.connect(self.installedVersionsChanged)
-        self._tool_data.remoteVersionsChanged.connect(self.remoteVersionsChanged)
-        self._tool_data.groupedRemoteVersionsChanged.connect(self.groupedRemoteVersionsChanged)
-        self._tool_data.currentVersionChanged.connect(self.currentVersionChanged)
-        self._tool_data.remoteVersionsLoadingChanged.connect(self.remoteVersionsLoadingChanged)
-        
-        self._config_data.configJsonChanged.connect(self.configJsonChanged)
-        
-        self._async_task.messageChanged.connect(self.messageChanged)
-        self._async_task.downloadProgressChanged.connect(self.downloadProgressChanged)
-        self._async_task.downloadInProgressChanged.connect(self.downloadInProgressChanged)
-        self._async_task.downloadToolNameChanged.connect(self.downloadToolNameChanged)
-        self._async_task.downloadingVersionChanged.connect(self.downloadingVersionChanged)
-        self._async_task.downloadedBytesChanged.connect(self.downloadedBytesChanged)
-        self._async_task.totalBytesChanged.connect(self.totalBytesChanged)
-        self._async_task.remoteVersionsLoaded.connect(self._on_remote_versions_loaded)
+        self._async_task.remoteVersionsReady.connect(self._on_remote_versions_loaded)
         self._async_task.downloadCompleted.connect(self._on_download_completed)
         self._log.debug("信号连接完成")
 
-    @Property(list, notify=toolsChanged)
-    def tools(self):
-        """获取工具列表。"""
-        return self._tool_data.tools
-
-    @Property(str, notify=currentToolChanged)
-    def currentTool(self) -> str:
-        """获取当前选中的工具。"""
-        return self._tool_data.currentTool
+    @Slot()
+    def shutdown(self):
+        """程序退出前保存镜像源状态。"""
+        self._log.info("程序退出，保存镜像源状态")
+        self._version_manager.remote_fetcher.persist()
 
-    @currentTool.setter
-    def currentTool(self, value: str):
-        """设置当前选中的工具。"""
+    @Slot(str)
+    def setCurrentTool(self, value: str):
+        """设置当前选中的工具（QML 槽函数）。"""
         old_value = self._tool_data.currentTool
-        self._log.debug(f"设置当前工具: 旧值={old_value}, 新值={value}")
+        if old_value == value:
+            return
+        self._log.debug("设置当前工具: 旧值=%s, 新值=%s", old_value, value)
         self._tool_data.currentTool = value
-        if old_value != value:
-            self._load_tool_data()
+        self._load_tool_data()
 
-    @Property(list, notify=installedVersionsChanged)
-    def installedVersions(self):
-        """获取已安装版本列表。"""
-        return self._tool_data.installedVersions
-
-    @Property(list, notify=remoteVersionsChanged)
-    def remoteVersions(self):
-        """获取远程可用版本列表。"""
-        return self._tool_data.remoteVersions
-
-    @Property(list, notify=groupedRemoteVersionsChanged)
-    def groupedRemoteVersions(self):
-        """获取分组后的远程版本列表。"""
-        return self._tool_data.groupedRemoteVersions
-
-    @Property(str, notify=currentVersionChanged)
-    def currentVersion(self) -> str:
-        """获取当前使用的版本。"""
-        return self._tool_data.currentVersion
-
-    @Property(str, notify=messageChanged)
-    def message(self) -> str:
-        """获取消息内容。"""
-        return self._async_task.message
-
-    @Property(int, notify=downloadProgressChanged)
-    def downloadProgress(self) -> int:
-        """获取下载进度。"""
-        return self._async_task.downloadProgress
-
-    @Property(bool, notify=downloadInProgressChanged)
-    def downloadInProgress(self) -> bool:
-        """获取下载是否正在进行。"""
-        return self._async_task.downloadInProgress
-
-    @Property(str, notify=configJsonChanged)
-    def configJson(self) -> str:
-        """获取配置 JSON 字符串。"""
-        return self._config_data.configJson
-
-    @configJson.setter
-    def configJson(self, value: str):
-        """设置配置 JSON 字符串。"""
+    @Slot(str)
+    def setConfigJson(self, value: str):
+        """设置配置 JSON 字符串（QML 槽函数）。"""
         self._config_data.configJson = value
 
     @Property(bool, notify=isAdminChanged)
     def isAdmin(self) -> bool:
         """检查是否以管理员权限运行。"""
+        if self._is_admin is None:
+            self._is_admin = is_admin()
+            self._log.debug("管理员权限状态: %s", self._is_admin)
         return self._is_admin
 
-    @Property(bool, notify=remoteVersionsLoadingChanged)
-    def remoteVersionsLoading(self) -> bool:
-        """获取远程版本加载状态。"""
-        return self._tool_data.remoteVersionsLoading
-
-    @remoteVersionsLoading.setter
-    def remoteVersionsLoading(self, value: bool):
-        """设置远程版本加载状态。"""
-        self._tool_data.remoteVersionsLoading = value
-
-    @Property(str, notify=downloadToolNameChanged)
-    def downloadToolName(self) -> str:
-        """获取下载工具名称。"""
-        return self._async_task.downloadToolName
-
-    @Property(str, notify=downloadingVersionChanged)
-    def downloadingVersion(self) -> str:
-        """获取正在下载的版本。"""
-        return self._async_task.downloadingVersion
-
-    @Property(int, notify=downloadedBytesChanged)
-    def downloadedBytes(self) -> int:
-        """获取已下载字节数。"""
-        return self._async_task.downloadedBytes
-
-    @Property(int, notify=totalBytesChanged)
-    def totalBytes(self) -> int:
-        """获取总字节数。"""
-        return self._async_task.totalBytes
-
-    @Slot(int, result=str)
-    def format_file_size(self, bytes: int) -> str:
-        """格式化文件大小。"""
-        return self._async_task.format_file_size(bytes)
-
     @Slot(str)
     def _set_message(self, msg: str):
         """设置消息内容。"""
@@ -233,33 +179,36 @@ class Backend(QObject):
 
     def _load_tool_data(self):
         """加载当前工具的数据。"""
-        self._log.debug(f"加载工具数据开始: 当前工具={self._tool_data.currentTool}")
-        self._tool_data.load_tool_data()
-        self._load_remote_versions_async()
+        self._log.debug("加载工具数据开始: 当前工具=%s", self._tool_data.currentTool)
+        # 先提交远程版本加载任务，使网络请求与本地扫描并行进行；
+        # 其结果经事件循环回到主线程，届时本地数据已加载完毕。
+        with self._tool_data.batch_updates():
+            self._load_remote_versions_async()
+            self._tool_data.load_tool_data()
         self._log.debug("工具数据加载完成")
 
     @Slot(str, str, bool)
     def lockVersion(self, tool: str, version: str, locked: bool):
         """锁定或解锁指定版本（QML 槽函数）。"""
-        self._log.info(f"{'锁定' if locked else '解锁'}版本请求: 工具={tool}, 版本={version}")
+        action = "锁定" if locked else "解锁"
+        self._log.info("%s版本请求: 工具=%s, 版本=%s", action, tool, version)
         if not tool or not version:
             self._log.warning("锁定/解锁版本失败: 工具或版本为空")
             return
-        self._set_message(f"正在{'锁定' if locked else '解锁'} {tool} 版本 {version}...")
+        self._set_message(f"正在{action} {tool} 版本 {version}...")
         if self._version_manager.lock_version(tool, version, locked):
-            action = "锁定" if locked else "解锁"
-            self._log.info(f"版本{action}成功: 工具={tool}, 版本={version}")
+            self._log.info("版本%s成功: 工具=%s, 版本=%s", action, tool, version)
             self._set_message(f"已{action} {tool} 版本 {version}")
             self._load_tool_data()
         else:
-            self._log.error(f"版本{action}失败: 工具={tool}, 版本={version}")
-            self._set_message(f"{'锁定' if locked else '解锁'}版本失败")
+            self._log.error("版本%s失败: 工具=%s, 版本=%s", action, tool, version)
+            self._set_message(f"{action}版本失败")
 
     @Slot()
     def loadRemoteVersions(self):
         """加载远程版本列表（QML 槽函数）。"""
         self._log.debug("加载远程版本列表请求")
-        self._load_remote_versions_async()
+        self._load_remote_versions_async(use_cache=False)
     
     @Slot()
     def loadInstalledVersions(self):
@@ -267,45 +216,66 @@ class Backend(QObject):
         self._log.debug("刷新已安装版本列表请求")
         self._load_tool_data()
 
-    def _load_remote_versions_async(self):
-        """异步加载远程可用版本列表。"""
+    def _load_remote_versions_async(self, use_cache: bool = True):
+        """
+        异步加载远程可用版本列表。
+        
+        参数:
+            use_cache: 是否使用已缓存的加载结果
+        """
         if not self._tool_data.currentTool:
             self._log.warning("异步加载远程版本失败: 当前工具为空")
             return
-        self._log.info(f"异步加载远程版本开始: 工具={self._tool_data.currentTool}")
+        self._log.info("异步加载远程版本开始: 工具=%s", self._tool_data.currentTool)
         self._tool_data.remoteVersionsLoading = True
-        self._async_task.load_remote_versions_async(self._tool_data.currentTool)
+        self._async_task.load_remote_versions_async(self._tool_data.currentTool, use_cache)
 
-    @Slot(str, list, list)
-    def _on_remote_versions_loaded(self, tool, versions, grouped_versions):
-        """远程版本加载完成后的回调方法。"""
-        self._log.info(f"远程版本加载完成: 工具={tool}, 版本数量={len(versions)}")
-        self._tool_data.update_remote_versions(tool, versions, grouped_versions)
-        self._set_message(f"已获取 {len(versions)} 个可用版本")
-        self._tool_data.remoteVersionsLoading = False
+    @Slot(str)
+    def _on_remote_versions_loaded(self, tool: str):
+        """
+        远程版本加载完成后的回调方法。
+        
+        参数:
+            tool: 加载完成的工具名称
+        """
+        if tool != self._tool_data.currentTool:
+            # 已切换到其他工具，结果保留在缓存中，切换回来时直接使用
+            return
+        result = self._async_task.get_cached_remote_versions(tool)
+        if result is None:
+            self._tool_data.remoteVersionsLoading = False
+            return
+        versions, grouped_versions = result
+        self._log.info("远程版本加载完成: 工具=%s, 版本数量=%s", tool, len(versions))
+        with self._tool_data.batch_updates():
+            self._tool_data.update_remote_versions(tool, versions, grouped_versions)
+            self._set_message(f"已获取 {len(versions)} 个可用版本")
+            self._tool_data.remoteVersionsLoading = False
 
     @Slot(str)
     def switchVersion(self, version: str):
         """切换到指定版本（QML 槽函数）。"""
-        self._log.info(f"切换版本请求: 工具={self._tool_data.currentTool}, 版本={version}")
+        self._log.info("切换版本请求: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
         if not self._tool_data.currentTool or not version:
             self._log.warning("切换版本失败: 工具或版本为空")
             return
+        if version == self._tool_data.currentVersion:
+            self._log.debug("版本已是当前版本，跳过切换: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
+            return
         self._set_message(f"正在切换 {self._tool_data.currentTool} 到版本 {version}...")
         if self._version_manager.switch_version(self._tool_data.currentTool, version):
-            self._log.info(f"版本切换成功: 工具={self._tool_data.currentTool}, 版本={version}")
+            self._log.info("版本切换成功: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
             self._set_message(f"已切换 {self._tool_data.currentTool} 到版本 {version}")
-            self._tool_data.load_tool_data()
-            self.currentVersionChanged.emit()
-            self.installedVersionsChanged.emit()
+            with self._tool_data.batch_updates():
+                self._tool_data.load_tool_data()
         else:
-            self._log.error(f"版本切换失败: 工具={self._tool_data.currentTool}, 版本={version}")
+            self._log.error("版本切换失败: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
             self._set_message(f"切换版本失败")
 
     @Slot(bool)
     def _on_download_completed(self, success: bool):
         """下载完成后的回调方法。"""
-        self._log.info(f"下载完成: 成功={success}")
+        self._log.info("下载完成: 成功=%s", success)
         if success:
             self._log.info("版本下载安装成功")
             self._load_tool_data()
@@ -315,7 +285,7 @@ class Backend(QObject):
     @Slot(str)
     def downloadVersion(self, version: str):
         """下载并安装指定版本（QML 槽函数）。"""
-        self._log.info(f"下载版本请求: 工具={self._tool_data.currentTool}, 版本={version}")
+        self._log.info("下载版本请求: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
         if not self._tool_data.currentTool or not version:
             self._log.warning("下载版本失败: 工具或版本为空")
             return
@@ -325,7 +295,7 @@ class Backend(QObject):
     @Slot(str)
     def deleteVersion(self, version: str):
         """删除指定版本（QML 槽函数）。"""
-        self._log.info(f"删除版本请求: 工具={self._tool_data.currentTool}, 版本={version}")
+        self._log.info("删除版本请求: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
         if not self._tool_data.currentTool or not version:
             self._log.warning("删除版本失败: 工具或版本为空")
             return
@@ -336,11 +306,11 @@ class Backend(QObject):
         
         self._set_message(f"正在删除 {self._tool_data.currentTool} {version}...")
         if self._version_manager.delete_version(self._tool_data.currentTool, version):
-            self._log.info(f"版本删除成功: 工具={self._tool_data.currentTool}, 版本={version}")
+            self._log.info("版本删除成功: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
             self._set_message(f"已删除 {self._tool_data.currentTool} {version}")
             self._load_tool_data()
         else:
-            self._log.error(f"版本删除失败: 工具={self._tool_data.currentTool}, 版本={version}")
+            self._log.error("版本删除失败: 工具=%s, 版本=%s", self._tool_data.currentTool, version)
             self._set_message("删除失败")
 
     @Slot()
@@ -353,21 +323,22 @@ class Backend(QObject):
     @Slot(str)
     def loadToolSpecificConfig(self, tool_name: str):
         """加载工具特定配置（QML 槽函数）。"""
-        self._log.debug(f"加载工具特定配置请求: 工具={tool_name}")
+        self._log.debug("加载工具特定配置请求: 工具=%s", tool_name)
         self._config_data.load_tool_specific_config(tool_name)
-        self._log.info(f"工具特定配置加载完成: 工具={tool_name}")
+        self._log.info("工具特定配置加载完成: 工具=%s", tool_name)
 
     @Slot(str, str, result=bool)
     def saveToolSpecificConfig(self, tool_name: str, config_json: str) -> bool:
         """保存工具特定配置（QML 槽函数）。"""
-        self._log.info(f"保存工具特定配置请求: 工具={tool_name}")
+        self._log.info("保存工具特定配置请求: 工具=%s", tool_name)
         result = self._config_data.save_tool_specific_config(tool_name, config_json)
+        self._tool_root_cache.clear()
         if result:
-            self._log.info(f"工具特定配置保存成功: 工具={tool_name}")
+            self._log.info("工具特定配置保存成功: 工具=%s", tool_name)
             self._set_message(f"{tool_name} 配置保存成功")
             self._tool_data.refresh_tools()
         else:
-            self._log.error(f"工具特定配置保存失败: 工具={tool_name}")
+            self._log.error("工具特定配置保存失败: 工具=%s", tool_name)
             self._set_message("配置保存失败")
         return result
 
@@ -376,10 +347,12 @@ class Backend(QObject):
         """保存配置（QML 槽函数）。"""
         self._log.info("保存配置请求")
         result = self._config_data.save_config(config_json)
+        self._tool_root_cache.clear()
         if result:
             self._log.info("配置保存成功")
             self._set_message("配置保存成功")
-            self._tool_data.refresh_tools()
+            with self._tool_data.batch_updates():
+                self._tool_data.refresh_tools()
         else:
             self._log.error("配置保存失败")
             self._set_message("配置保存失败")
@@ -388,67 +361,77 @@ class Backend(QObject):
     @Slot(str, str)
     def setToolRoot(self, tool: str, path: str):
         """设置工具根目录（QML 槽函数）。"""
-        self._log.info(f"设置工具根目录请求: 工具={tool}, 路径={path}")
+        self._log.info("设置工具根目录请求: 工具=%s, 路径=%s", tool, path)
         self._config_data.set_tool_root(tool, path)
+        self._tool_root_cache.clear()
         self._tool_data.refresh_tools()
         self._set_message(f"已设置 {tool} 根目录为 {path}")
 
     @Slot(str, result=str)
     def getToolRoot(self, tool: str) -> str:
         """获取工具根目录（QML 槽函数）。"""
-        self._log.debug(f"获取工具根目录请求: 工具={tool}")
-        return self._config_data.get_tool_root(tool)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("获取工具根目录请求: 工具=%s", tool)
+        root = self._tool_root_cache.get(tool)
+        if root is None:
+            root = self._config_data.get_tool_root(tool)
+            self._tool_root_cache[tool] = root
+        return root
 
     @Slot()
     def resetToDefaultConfig(self):
         """重置配置为默认配置（QML 槽函数）。"""
         self._log.info("重置配置为默认配置请求")
         self._config_data.reset_to_default()
-        self._tool_data.refresh_tools()
-        self._tool_data.reset_current_tool()
+        self._tool_root_cache.clear()
+        with self._tool_data.batch_updates():
+            self._tool_data.refresh_tools()
+            self._tool_data.reset_current_tool()
         self._log.info("配置已重置为默认配置")
         self._set_message("已恢复默认配置")
 
     @Slot(str, result=bool)
     def addToolConfig(self, tool_name: str) -> bool:
         """添加新工具配置（QML 槽函数）。"""
-        self._log.info(f"添加工具配置请求: 工具={tool_name}")
+        self._log.info("添加工具配置请求: 工具=%s", tool_name)
         if not tool_name or not tool_name.strip():
             self._log.warning("添加工具配置失败: 工具名称为空")
             self._set_message("工具名称不能为空")
             return False
         
-        tool_name = tool_name.strip().lower()
+        tool_name = _normalize_tool_name(tool_name)
         if self._config_data.add_tool_config(tool_name):
-            self._log.info(f"工具配置添加成功: 工具={tool_name}")
+            self._tool_root_cache.clear()
+            self._log.info("工具配置添加成功: 工具=%s", tool_name)
             self._tool_data.refresh_tools()
             self._config_data.load_config()
             self._set_message(f"已添加工具配置: {tool_name}")
             return True
         else:
-            self._log.warning(f"工具配置添加失败: 工具={tool_name} 已存在")
+            self._log.warning("工具配置添加失败: 工具=%s 已存在", tool_name)
             self._set_message(f"工具 {tool_name} 已存在")
             return False
 
     @Slot(str, result=bool)
     def deleteToolConfig(self, tool_name: str) -> bool:
         """删除工具配置（QML 槽函数）。"""
-        self._log.info(f"删除工具配置请求: 工具={tool_name}")
+        self._log.info("删除工具配置请求: 工具=%s", tool_name)
         if not tool_name or not tool_name.strip():
             self._log.warning("删除工具配置失败: 工具名称为空")
             self._set_message("工具名称不能为空")
             return False
         
-        tool_name = tool_name.strip().lower()
+        tool_name = _normalize_tool_name(tool_name)
         if self._config_data.delete_tool_config(tool_name):
-            self._log.info(f"工具配置删除成功: 工具={tool_name}")
+            self._tool_root_cache.clear()
+            self._log.info("工具配置删除成功: 工具=%s", tool_name)
             self._tool_data.refresh_tools()
             self._tool_data.reset_current_tool()
             self._config_data.load_config()
             self._set_message(f"已删除工具配置: {tool_name}")
             return True
         else:
-            self._log.error(f"工具配置删除失败: 工具={tool_name}")
+            self._log.error("工具配置删除失败: 工具=%s", tool_name)
             self._set_message("删除工具配置失败")
             return False
 
@@ -457,18 +440,21 @@ class Backend(QObject):
         """清空缓存（QML 槽函数）。"""
         self._log.info("清空缓存请求")
         self._config_data.clear_cache()
+        self._version_manager.clear_memory_cache()
+        self._async_task.clear_remote_cache()
         self._log.info("缓存已清空")
         self._set_message("缓存已清空")
 
     @Slot(str, result=str)
     def getToolConfigJson(self, tool_name: str) -> str:
         """获取 settings 字段的配置 JSON 字符串（QML 槽函数）。"""
-        self._log.debug(f"获取工具配置 JSON 请求: 工具={tool_name}")
+        self._log.debug("获取工具配置 JSON 请求: 工具=%s", tool_name)
         return self._config_data.get_tool_config_json()
 
+    @Slot(bool)
     def _set_remote_versions_loading(self, value: bool):
         """设置远程版本加载状态（内部使用）。"""
-        self._log.debug(f"设置远程版本加载状态: {value}")
+        self._log.debug("设置远程版本加载状态: %s", value)
         self._tool_data.remoteVersionsLoading = value
 
 
@@ -479,12 +465,17 @@ def run_gui():
     返回:
         退出码
     """
-    app = QApplication(sys.argv)
+    app = QGuiApplication(sys.argv)
     app.setApplicationName("Mysysenv")
     app.setOrganizationName("Mysysenv")
     engine = QQmlApplicationEngine()
     backend = Backend()
-    engine.rootContext().setContextProperty("backend", backend)
+    app.aboutToQuit.connect(backend.shutdown)
+    context = engine.rootContext()
+    context.setContextProperty("backend", backend)
+    context.setContextProperty("toolData", backend._tool_data)
+    context.setContextProperty("configData", backend._config_data)
+    context.setContextProperty("asyncTask", backend._async_task)
     qml_dir = Path(__file__).parent / "qml"
     main_qml = qml_dir / "Main.qml"
     if main_qml.exists():
@@ -194,7 +194,7 @@ ColumnLayout {
 
             TextArea {
                 id: configTextArea
-                text: backend ? backend.configJson : ""
+                text: configData ? configData.configJson : ""
                 font.family: "Consolas"
                 font.pixelSize: 13
                 selectByMouse: true
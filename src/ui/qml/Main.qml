@@ -240,7 +240,7 @@ ApplicationWindow {
                     root.configContext = sidebar.configContext
                 }
                 onToolSelected: {
-                    if (backend) backend.logInfo("[QML] Tool selected: " + (backend.currentTool || "none"))
+                    if (backend) backend.logInfo("[QML] Tool selected: " + (toolData.currentTool || "none"))
                 }
             }
             
@@ -282,14 +282,14 @@ ApplicationWindow {
                         Layout.preferredHeight: 8
                         from: 0
                         to: 100
-                        value: (backend && backend.downloadInProgress) ? backend.downloadProgress : 0
-                        visible: backend && backend.downloadInProgress
+                        value: (asyncTask && asyncTask.downloadInProgress) ? asyncTask.downloadProgress : 0
+                        visible: asyncTask && asyncTask.downloadInProgress
                     }
                     
                     Text {
                         id: progressPercent
-                        visible: backend && backend.downloadInProgress
-                        text: (backend && backend.downloadInProgress) ? (backend.downloadProgress + "%") : "0%"
+                        visible: asyncTask && asyncTask.downloadInProgress
+                        text: (asyncTask && asyncTask.downloadInProgress) ? (asyncTask.downloadProgress + "%") : "0%"
                         font.pixelSize: 12
                         font.bold: true
                         color: theme.primaryColor
@@ -302,11 +302,11 @@ ApplicationWindow {
                     Layout.fillHeight: true
                     verticalAlignment: Text.AlignVCenter
                     text: {
-                        if (backend && backend.downloadInProgress) {
-                            var toolName = backend.downloadToolName || ""
-                            var version = backend.downloadingVersion || ""
-                            var downloaded = backend.format_file_size(backend.downloadedBytes)
-                            var total = backend.format_file_size(backend.totalBytes)
+                        if (asyncTask && asyncTask.downloadInProgress) {
+                            var toolName = asyncTask.downloadToolName || ""
+                            var version = asyncTask.downloadingVersion || ""
+                            var downloaded = asyncTask.formattedDownloaded
+                            var total = asyncTask.formattedTotal
                             if (toolName && version) {
                                 return "正在下载 " + toolName + " " + version + " - " + downloaded + "/" + total
                             } else if (toolName) {
@@ -315,7 +315,7 @@ ApplicationWindow {
                                 return "正在下载 - " + downloaded + "/" + total
                             }
                         } else {
-                            return backend ? backend.message : ""
+                            return asyncTask ? asyncTask.message : ""
                         }
                     }
                     font.pixelSize: 12
@@ -353,12 +353,12 @@ ApplicationWindow {
     }
     
     Connections {
-        target: backend
-        enabled: !!backend
+        target: toolData
+        enabled: !!toolData
         
         function onCurrentToolChanged() {
-            if (backend) backend.logDebug("[QML] Current tool changed to: " + backend.currentTool)
-            if (backend && backend.currentTool !== "") {
+            if (backend) backend.logDebug("[QML] Current tool changed to: " + toolData.currentTool)
+            if (toolData && toolData.currentTool !== "") {
                 backend.loadConfig()
             }
         }
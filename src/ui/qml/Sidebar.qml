@@ -48,7 +48,7 @@ Rectangle {
                 id: toolList
                 anchors.fill: parent
                 anchors.margins: 8
-                model: backend ? backend.tools : []
+                model: toolData ? toolData.tools : []
                 clip: true
                 spacing: 6
 
@@ -57,7 +57,7 @@ Rectangle {
                     width: toolList.width
                     height: 48
 
-                    property bool isSelected: backend ? (backend.currentTool === modelData.name) : false
+                    property bool isSelected: backend ? (toolData.currentTool === modelData.name) : false
                     property bool hovered: false
 
                     Rectangle {
@@ -101,10 +101,10 @@ Rectangle {
                         onClicked: {
                         if (backend) backend.logDebug("[QML] Tool list item clicked: " + modelData.name)
                         if (backend) {
-                            if (backend.currentTool === modelData.name) {
-                                backend.currentTool = ""
+                            if (toolData.currentTool === modelData.name) {
+                                backend.setCurrentTool("")
                             } else {
-                                backend.currentTool = modelData.name
+                                backend.setCurrentTool(modelData.name)
                             }
                         }
                         if (stackView) {
@@ -150,10 +150,10 @@ Rectangle {
                 onClicked: {
                     if (backend) backend.logInfo("[QML] Config button clicked")
                     if (backend) {
-                        if (backend.currentTool !== "") {
-                            root.configContext = backend.currentTool
-                            backend.logDebug("[QML] Loading tool-specific config for: " + backend.currentTool)
-                            backend.loadToolSpecificConfig(backend.currentTool)
+                        if (toolData.currentTool !== "") {
+                            root.configContext = toolData.currentTool
+                            backend.logDebug("[QML] Loading tool-specific config for: " + toolData.currentTool)
+                            backend.loadToolSpecificConfig(toolData.currentTool)
                         } else {
                             root.configContext = ""
                             backend.logDebug("[QML] Loading general config")
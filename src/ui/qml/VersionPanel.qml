@@ -30,7 +30,7 @@ ColumnLayout {
         Layout.margins: 24
 
         Text {
-            text: backend ? (backend.currentTool ? backend.currentTool.toUpperCase() : qsTr("请选择工具")) : ""
+            text: backend ? (toolData.currentTool ? toolData.currentTool.toUpperCase() : qsTr("请选择工具")) : ""
             font.pixelSize: 28
             font.bold: true
             color: theme ? theme.textPrimary : "#000000"
@@ -39,7 +39,7 @@ ColumnLayout {
         Item { Layout.fillWidth: true }
 
         Rectangle {
-            visible: !!backend && !!backend.currentTool && backend.currentTool !== ""
+            visible: !!toolData && !!toolData.currentTool && toolData.currentTool !== ""
             width: currentVersionLabel.width + 24
             height: 32
             radius: 8
@@ -49,7 +49,7 @@ ColumnLayout {
 
             Text {
                 id: currentVersionLabel
-                text: qsTr("当前版本: ") + (backend ? (backend.currentVersion || qsTr("未设置")) : qsTr("未设置"))
+                text: qsTr("当前版本: ") + (backend ? (toolData.currentVersion || qsTr("未设置")) : qsTr("未设置"))
                 font.pixelSize: 13
                 font.bold: true
                 color: "#1d4ed8"
@@ -135,16 +135,16 @@ ColumnLayout {
                     id: installedList
                     anchors.fill: parent
                     anchors.margins: 10
-                    model: backend ? backend.installedVersions : []
+                    model: toolData ? toolData.installedVersions : []
                     clip: true
                     spacing: 8
 
                     delegate: Rectangle {
                         width: installedList.width
                         height: 56
-                        color: (modelData && backend && modelData.version === backend.currentVersion) ? "#eff6ff" : (hovered ? (theme ? theme.surfaceHover : "#f3f4f6") : "transparent")
+                        color: (modelData && backend && modelData.version === toolData.currentVersion) ? "#eff6ff" : (hovered ? (theme ? theme.surfaceHover : "#f3f4f6") : "transparent")
                         radius: 8
-                        border.color: (modelData && backend && modelData.version === backend.currentVersion) ? "#bfdbfe" : (hovered ? (theme ? theme.borderColor : "#e5e7eb") : "transparent")
+                        border.color: (modelData && backend && modelData.version === toolData.currentVersion) ? "#bfdbfe" : (hovered ? (theme ? theme.borderColor : "#e5e7eb") : "transparent")
                         border.width: 1
 
                         property bool hovered: false
@@ -202,7 +202,7 @@ ColumnLayout {
                             }
 
                             Rectangle {
-                                visible: modelData && backend && modelData.version === backend.currentVersion
+                                visible: modelData && backend && modelData.version === toolData.currentVersion
                                 width: currentText.width + 12
                                 height: 20
                                 radius: 10
@@ -221,7 +221,7 @@ ColumnLayout {
                             Item { Layout.fillWidth: true }
 
                             Rectangle {
-                                visible: modelData && backend && modelData.version !== backend.currentVersion
+                                visible: modelData && backend && modelData.version !== toolData.currentVersion
                                 width: 64
                                 height: 32
                                 color: parent.hovered ? (theme ? theme.primaryDark : "#2563eb") : (dataIsSystem ? "#e5e7eb" : (theme ? theme.primaryColor : "#3b82f6"))
@@ -312,9 +312,9 @@ ColumnLayout {
 
                                     onClicked: {
                                         if (backend) backend.logInfo("[QML] " + (dataLocked ? "Unlocking" : "Locking") + " version: " + modelData.version)
-                                        if (modelData && backend && modelData.version && backend.currentTool) {
+                                        if (modelData && backend && modelData.version && toolData.currentTool) {
                                             try {
-                                                backend.lockVersion(backend.currentTool, modelData.version, !dataLocked)
+                                                backend.lockVersion(toolData.currentTool, modelData.version, !dataLocked)
                                             } catch (e) {
                                                 backend.logError("[QML] Error calling backend.lockVersion: " + e)
                                             }
@@ -324,7 +324,7 @@ ColumnLayout {
                             }
 
                             Rectangle {
-                                visible: modelData && backend && modelData.version !== backend.currentVersion
+                                visible: modelData && backend && modelData.version !== toolData.currentVersion
                                 width: 64
                                 height: 32
                                 color: parent.hovered ? "#b91c1c" : ((dataLocked || dataIsSystem) ? "#e5e7eb" : (theme ? theme.dangerColor : "#ef4444"))
@@ -407,7 +407,7 @@ ColumnLayout {
                 }
 
                 Text {
-                    visible: !!backend && !!backend.remoteVersionsLoading
+                    visible: !!toolData && !!toolData.remoteVersionsLoading
                     text: qsTr(" (加载中...)")
                     font.pixelSize: 14
                     color: theme ? theme.primaryColor : "#3b82f6"
@@ -418,9 +418,9 @@ ColumnLayout {
                 Rectangle {
                     width: 80
                     height: 36
-                    color: parent.hovered ? (theme ? theme.primaryDark : "#2563eb") : ((!!backend && !!backend.remoteVersionsLoading) ? "#e5e7eb" : (theme ? theme.primaryColor : "#3b82f6"))
+                    color: parent.hovered ? (theme ? theme.primaryDark : "#2563eb") : ((!!toolData && !!toolData.remoteVersionsLoading) ? "#e5e7eb" : (theme ? theme.primaryColor : "#3b82f6"))
                     radius: 8
-                    enabled: !!backend && !!(backend && !backend.remoteVersionsLoading)
+                    enabled: !!toolData && !!(toolData && !toolData.remoteVersionsLoading)
                     property bool hovered: false
 
                     Behavior on color {
@@ -432,14 +432,14 @@ ColumnLayout {
                         text: qsTr("刷新")
                         font.pixelSize: 13
                         font.bold: true
-                        color: (backend && backend.remoteVersionsLoading) ? "#9ca3af" : "#ffffff"
+                        color: (toolData && toolData.remoteVersionsLoading) ? "#9ca3af" : "#ffffff"
                     }
 
                     MouseArea {
                         id: refreshBtn
                         anchors.fill: parent
                         hoverEnabled: true
-                        enabled: !!backend && !!(backend && !backend.remoteVersionsLoading)
+                        enabled: !!toolData && !!(toolData && !toolData.remoteVersionsLoading)
                         cursorShape: Qt.PointingHandCursor
 
                         onEntered: if (parent.enabled) parent.hovered = true
@@ -471,7 +471,7 @@ ColumnLayout {
                     id: remoteList
                     anchors.fill: parent
                     anchors.margins: 10
-                    model: backend ? backend.groupedRemoteVersions : []
+                    model: toolData ? toolData.groupedRemoteVersions : []
                     clip: true
                     spacing: 8
 
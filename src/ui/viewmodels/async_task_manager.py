@@ -4,14 +4,63 @@
 负责异步任务和线程的管理。
 """
 
-from typing import Optional, Callable, Any, List, Dict
-from PySide6.QtCore import QObject, Signal, Property, Slot, QRunnable, QThreadPool, QMetaObject, Qt, Q_ARG
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Callable, Any, List, Dict, Set, Tuple
+import requests
+from PySide6.QtCore import QObject, Signal, Property, Slot, QRunnable, QThreadPool, QMetaObject, Qt, Q_ARG, QTimer
 
 from src.core.version_manager import VersionManager
 from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# 预期内的网络错误只记录警告，不渲染完整堆栈。
+_NETWORK_ERRORS = (ConnectionError, TimeoutError, requests.RequestException)
+
+_SIZE_UNITS = (("B", 0), ("KB", 10), ("MB", 20), ("GB", 30))
+
+
+@lru_cache(maxsize=4096)
+def _format_size(size: int) -> str:
+    """
+    将字节数格式化为带单位的字符串。
+    
+    参数:
+        size: 字节数
+        
+    返回:
+        格式化后的大小字符串
+    """
+    if size <= 0:
+        return "0 B"
+    
+    idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    if idx == 0:
+        return f"{size} B"
+    unit, shift = _SIZE_UNITS[idx]
+    return f"{size / (1 << shift):.2f} {unit}"
+
+
+def _post(target: QObject, slot: str, *args) -> None:
+    """
+    以队列连接方式在目标对象所在线程调用槽函数。
+    
+    目标对象已被销毁时静默忽略。
+    
+    参数:
+        target: 目标对象
+        slot: 槽函数名称
+        *args: 由 Q_ARG 构造的参数
+    """
+    try:
+        QMetaObject.invokeMethod(target, slot, Qt.QueuedConnection, *args)
+    except RuntimeError:
+        pass
+
 
 class RemoteVersionsLoader(QRunnable):
     """远程版本加载器（在后台线程执行）。"""
@@ -47,48 +96,94 @@ class RemoteVersionsLoader(QRunnable):
             sorted_versions = self.version_manager.sort_versions_desc(remote)
             logger.debug(f"[ASYNC] 版本排序完成")
             
-            versions = [
+            # 只构造一次前端所需的版本字典，平铺列表与分组列表共享同一批对象。
+            # 已排序列表分组时保持原有顺序，各分组依次对应 normalized 中的连续片段。
+            normalized = [
                 {
                     "version": v["version"],
                     "downloadUrl": v.get("download_url", ""),
                     "lts": v.get("lts", False)
                 }
-                for v in sorted_versions[:100]
+                for v in sorted_versions
             ]
+            versions = normalized[:100]
             
-            grouped = self.version_manager.group_versions_by_major(remote)
-            grouped_versions = []
-            for group in grouped:
-                group_data = {
+            grouped = self.version_manager.group_versions_by_major(sorted_versions)
+            grouped_versions = [None] * len(grouped)
+            start = 0
+            for i, group in enumerate(grouped):
+                end = start + len(group["versions"])
+                grouped_versions[i] = {
                     "majorVersion": group["major_version"],
                     "hasLts": group.get("has_lts", False),
-                    "versions": [
-                        {
-                            "version": v["version"],
-                            "downloadUrl": v.get("download_url", ""),
-                            "lts": v.get("lts", False)
-                        }
-                        for v in group["versions"]
-                    ]
+                    "versions": normalized[start:end]
                 }
-                grouped_versions.append(group_data)
+                start = end
             
             logger.info(f"[ASYNC] 成功加载 {len(versions)} 个 {self.tool} 版本，分组数: {len(grouped_versions)}")
             
-            self.callback_obj.remoteVersionsLoaded.emit(self.tool, versions, grouped_versions)
-            logger.debug(f"[ASYNC] 已发送 remoteVersionsLoaded 信号")
+            # 获取失败或结果为空时不写入缓存，以便下次加载（包括手动刷新）重新获取
+            if versions:
+                self.callback_obj._store_remote_versions(self.tool, versions, grouped_versions)
+            else:
+                self.callback_obj._discard_remote_versions(self.tool)
+            self.callback_obj.remoteVersionsReady.emit(self.tool)
+            logger.debug(f"[ASYNC] 已发送 remoteVersionsReady 信号")
+        except _NETWORK_ERRORS as e:
+            logger.warning("[ASYNC] 获取 %s 版本失败（网络错误）: %s", self.tool, e)
         except Exception as e:
             error_msg = f"获取 {self.tool} 版本失败: {e}"
             logger.error(f"[ASYNC] {error_msg}", exc_info=True)
+        finally:
+            self.callback_obj._clear_inflight(self.tool)
     
     def _set_message(self, msg: str):
         """设置消息。"""
-        QMetaObject.invokeMethod(
-            self.callback_obj,
-            "_set_message",
-            Qt.QueuedConnection,
-            Q_ARG(str, msg)
-        )
+        _post(self.callback_obj, "_set_message", Q_ARG(str, msg))
+
+
+class VersionsPrefetcher(QRunnable):
+    """版本信息预取器（在后台线程执行）。"""
+    
+    def __init__(self, tools: List[str], version_manager: VersionManager):
+        """
+        初始化版本信息预取器。
+        
+        参数:
+            tools: 工具名称列表
+            version_manager: 版本管理器实例
+        """
+        super().__init__()
+        self.tools = tools
+        self.version_manager = version_manager
+    
+    def run(self):
+        """在后台线程并发预取所有工具的版本信息。"""
+        logger.info(f"[ASYNC] VersionsPrefetcher.run 开始执行: {len(self.tools)} 个工具")
+        try:
+            self.version_manager.prefetch_all(self.tools)
+        except _NETWORK_ERRORS as e:
+            logger.warning("[ASYNC] 预取版本信息失败（网络错误）: %s", e)
+        except Exception as e:
+            logger.error(f"[ASYNC] 预取版本信息失败: {e}", exc_info=True)
+
+
+@dataclass(slots=True)
+class DownloadState:
+    """
+    下载状态更新。
+    
+    为 None 的字段表示保持不变，由 AsyncTaskManager.apply_download_state 合并；
+    complete 为 True 时表示下载结束，success 为下载结果。
+    """
+    message: Optional[str] = None
+    progress: Optional[int] = None
+    tool: Optional[str] = None
+    version: Optional[str] = None
+    downloaded: Optional[int] = None
+    total: Optional[int] = None
+    complete: bool = False
+    success: bool = False
 
 
 class Downloader(QRunnable):
@@ -119,25 +214,24 @@ class Downloader(QRunnable):
         try:
             if not self.tool or not self.version:
                 logger.warning("[ASYNC] 下载失败: 工具名称或版本为空")
-                self._set_message(f"下载失败: 工具名称或版本为空")
+                self._emit_state(message="下载失败: 工具名称或版本为空")
                 return
                 
-            self._set_message(f"正在下载 {self.tool} {self.version}...")
-            self._set_download_progress(0)
-            self._set_download_tool_name(self.tool)
-            self._set_downloading_version(self.version)
-            self._set_downloaded_bytes(0)
-            self._set_total_bytes(0)
+            self._emit_state(
+                message=f"正在下载 {self.tool} {self.version}...",
+                progress=0,
+                tool=self.tool,
+                version=self.version,
+                downloaded=0,
+                total=0,
+            )
             logger.debug(f"[ASYNC] 开始调用 version_manager.download_version({self.tool}, {self.version})")
             
             def progress_callback(downloaded: int, total: int):
-                progress = int(downloaded / total * 100) if total > 0 else 0
-                self._set_download_progress(progress)
-                self._set_downloaded_bytes(downloaded)
-                self._set_total_bytes(total)
+                self._report_progress(downloaded, total)
             
             def status_callback(msg: str):
-                self._set_message(msg)
+                self._emit_state(message=msg)
             
             success = self.version_manager.download_version(
                 self.tool, self.version, progress_callback, status_callback, self.version_info
@@ -145,132 +239,40 @@ class Downloader(QRunnable):
             
             if success:
                 logger.info(f"[ASYNC] 成功下载并安装 {self.tool} 版本 {self.version}")
-                self._set_message(f"已成功安装 {self.tool} {self.version}")
+                self._emit_state(message=f"已成功安装 {self.tool} {self.version}")
             else:
                 logger.warning(f"[ASYNC] {self.tool} 版本 {self.version} 下载失败")
-                self._set_message(f"下载失败")
+                self._emit_state(message="下载失败")
+        except _NETWORK_ERRORS as e:
+            logger.warning("[ASYNC] 下载 %s 版本 %s 时发生网络错误: %s", self.tool, self.version, e)
+            self._emit_state(message=f"下载失败: {e}")
         except Exception as e:
             error_msg = f"下载 {self.tool} 版本 {self.version} 时发生异常: {e}"
             logger.error(f"[ASYNC] {error_msg}", exc_info=True)
-            try:
-                self._set_message(f"下载失败: {e}")
-            except:
-                logger.debug("[ASYNC] 无法设置错误消息，回调对象可能已删除")
+            self._emit_state(message=f"下载失败: {e}")
         finally:
-            try:
-                self._set_download_complete()
-            except:
-                logger.debug("[ASYNC] 无法设置下载完成，回调对象可能已删除")
-            try:
-                if self.callback_obj:
-                    self.callback_obj.downloadCompleted.emit(success)
-                    logger.debug(f"[ASYNC] 已发送 downloadCompleted 信号，结果: {success}")
-            except:
-                logger.debug("[ASYNC] 无法发送 downloadCompleted 信号，回调对象可能已删除")
-    
-    def _set_message(self, msg: str):
-        """设置消息。"""
-        try:
-            if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "_set_message",
-                    Qt.QueuedConnection,
-                    Q_ARG(str, msg)
-                )
-        except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置消息")
-        except Exception as e:
-            logger.debug(f"[ASYNC] 设置消息时出错: {e}")
-    
-    def _set_download_progress(self, progress: int):
-        """设置下载进度。"""
-        try:
-            if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "set_download_progress",
-                    Qt.QueuedConnection,
-                    Q_ARG(int, progress)
-                )
-        except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置下载进度")
-        except Exception as e:
-            logger.debug(f"[ASYNC] 设置下载进度时出错: {e}")
-    
-    def _set_download_complete(self):
-        """设置下载完成。"""
-        try:
-            if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "set_download_complete",
-                    Qt.QueuedConnection
-                )
-        except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置下载完成")
-        except Exception as e:
-            logger.debug(f"[ASYNC] 设置下载完成时出错: {e}")
+            self._emit_state(complete=True, success=success)
     
-    def _set_download_tool_name(self, tool_name: str):
-        """设置下载工具名称。"""
-        try:
-            if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "set_download_tool_name",
-                    Qt.QueuedConnection,
-                    Q_ARG(str, tool_name)
-                )
-        except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置工具名称")
-        except Exception as e:
-            logger.debug(f"[ASYNC] 设置工具名称时出错: {e}")
-    
-    def _set_downloading_version(self, version: str):
-        """设置正在下载的版本。"""
-        try:
-            if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "set_downloading_version",
-                    Qt.QueuedConnection,
-                    Q_ARG(str, version)
-                )
-        except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置版本")
-        except Exception as e:
-            logger.debug(f"[ASYNC] 设置版本时出错: {e}")
-    
-    def _set_downloaded_bytes(self, bytes: int):
-        """设置已下载字节数。"""
-        try:
-            if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "set_downloaded_bytes",
-                    Qt.QueuedConnection,
-                    Q_ARG(int, bytes)
-                )
-        except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置已下载字节数")
-        except Exception as e:
-            logger.debug(f"[ASYNC] 设置已下载字节数时出错: {e}")
+    def _report_progress(self, downloaded: int, total: int):
+        """记录最新下载进度，由主线程定时器统一刷新到界面。"""
+        if self.callback_obj:
+            self.callback_obj._pending_progress = (downloaded, total)
     
-    def _set_total_bytes(self, bytes: int):
-        """设置总字节数。"""
+    def _emit_state(self, **changes):
+        """
+        将下载状态更新一次性发送到主线程。
+        
+        参数:
+            **changes: DownloadState 中需要更新的字段
+        """
         try:
             if self.callback_obj:
-                QMetaObject.invokeMethod(
-                    self.callback_obj,
-                    "set_total_bytes",
-                    Qt.QueuedConnection,
-                    Q_ARG(int, bytes)
-                )
+                self.callback_obj.downloadStateChanged.emit(DownloadState(**changes))
         except RuntimeError:
-            logger.debug("[ASYNC] 回调对象已删除，跳过设置总字节数")
+            logger.debug("[ASYNC] 回调对象已删除，跳过更新下载状态")
         except Exception as e:
-            logger.debug(f"[ASYNC] 设置总字节数时出错: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ASYNC] 更新下载状态时出错: %s", e)
 
 
 class AsyncTaskManager(QObject):
@@ -283,13 +285,17 @@ class AsyncTaskManager(QObject):
     messageChanged = Signal()
     downloadProgressChanged = Signal()
     downloadInProgressChanged = Signal()
-    remoteVersionsLoaded = Signal(str, list, list)
+    remoteVersionsReady = Signal(str)
     downloadCompleted = Signal(bool)
+    downloadStateChanged = Signal(object)
     downloadToolNameChanged = Signal()
     downloadingVersionChanged = Signal()
     downloadedBytesChanged = Signal()
     totalBytesChanged = Signal()
 
+    PROGRESS_FLUSH_INTERVAL_MS = 100
+    REMOTE_CACHE_TTL_S = 60.0
+
     def __init__(self, version_manager: VersionManager, parent=None):
         """
         初始化异步任务管理器。
@@ -308,10 +314,24 @@ class AsyncTaskManager(QObject):
         self._downloading_version: str = ""
         self._downloaded_bytes: int = 0
         self._total_bytes: int = 0
-        self._thread_pool = QThreadPool()
-        self._thread_pool.setMaxThreadCount(4)
+        self._formatted_downloaded: str = _format_size(0)
+        self._formatted_total: str = _format_size(0)
+        self._meta_pool = QThreadPool(self)
+        self._meta_pool.setMaxThreadCount(4)
+        self._download_pool = QThreadPool(self)
+        self._download_pool.setMaxThreadCount(2)
         self._remote_versions_loading: bool = False
-        logger.debug(f"[ASYNC] 线程池最大线程数设置为 4")
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._remote_cache: Dict[str, Tuple[float, list, list]] = {}
+        self._remote_cache_lock = threading.Lock()
+        self._inflight: Set[str] = set()
+        self._inflight_lock = threading.Lock()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self.downloadStateChanged.connect(self.apply_download_state)
+        self._pending_signals: Dict[str, None] = {}
+        logger.debug("[ASYNC] 线程池最大线程数: 版本信息=4, 下载=2")
 
     @Property(str, notify=messageChanged)
     def message(self) -> str:
@@ -348,11 +368,95 @@ class AsyncTaskManager(QObject):
         """获取总字节数。"""
         return self._total_bytes
 
+    @Property(str, notify=downloadedBytesChanged)
+    def formattedDownloaded(self) -> str:
+        """获取格式化后的已下载大小。"""
+        return self._formatted_downloaded
+
+    @Property(str, notify=totalBytesChanged)
+    def formattedTotal(self) -> str:
+        """获取格式化后的总大小。"""
+        return self._formatted_total
+
+    def _store_remote_versions(self, tool: str, versions: list, grouped_versions: list):
+        """
+        缓存远程版本加载结果（可在后台线程调用）。
+        
+        参数:
+            tool: 工具名称
+            versions: 版本列表
+            grouped_versions: 分组版本列表
+        """
+        with self._remote_cache_lock:
+            self._remote_cache[tool] = (time.monotonic(), versions, grouped_versions)
+
+    def _discard_remote_versions(self, tool: str):
+        """
+        移除工具已缓存的远程版本加载结果（可在后台线程调用）。
+        
+        参数:
+            tool: 工具名称
+        """
+        with self._remote_cache_lock:
+            self._remote_cache.pop(tool, None)
+
+    def _clear_inflight(self, tool: str):
+        """
+        清除工具的远程版本加载进行中标记（可在后台线程调用）。
+        
+        参数:
+            tool: 工具名称
+        """
+        with self._inflight_lock:
+            self._inflight.discard(tool)
+
+    def get_cached_remote_versions(self, tool: str) -> Optional[Tuple[list, list]]:
+        """
+        获取工具已缓存的远程版本加载结果。
+        
+        结果由后台线程按工具写入缓存，remoteVersionsReady 信号只携带工具名称，
+        避免跨线程排队时对大列表逐项转换，多个工具的结果也不会互相覆盖。
+        
+        参数:
+            tool: 工具名称
+            
+        返回:
+            (版本列表, 分组版本列表)，无缓存时返回 None
+        """
+        with self._remote_cache_lock:
+            cached = self._remote_cache.get(tool)
+        if cached is None:
+            return None
+        return cached[1], cached[2]
+
+    def clear_remote_cache(self):
+        """清空已缓存的远程版本加载结果，下次加载将重新向版本管理器查询。"""
+        with self._remote_cache_lock:
+            self._remote_cache.clear()
+
+    def _notify(self, name: str):
+        """
+        登记属性变更信号，在本轮事件循环结束后统一发送，同一信号只发送一次。
+        
+        参数:
+            name: 信号名称
+        """
+        if not self._pending_signals:
+            QTimer.singleShot(0, self._flush_notifies)
+        self._pending_signals[name] = None
+
+    @Slot()
+    def _flush_notifies(self):
+        """发送所有已登记的属性变更信号。"""
+        pending, self._pending_signals = self._pending_signals, {}
+        for name in pending:
+            getattr(self, name).emit()
+
     @Slot(str)
     def _set_message(self, msg: str):
         """设置消息内容。"""
         self._message = msg
-        self.messageChanged.emit()
+        self._notify("messageChanged")
         logger.info(f"[ASYNC] {msg}")
 
     @Slot(int)
@@ -360,75 +464,126 @@ class AsyncTaskManager(QObject):
         """设置下载进度。"""
         clamped_progress = max(0, min(100, progress))
         if clamped_progress != self._download_progress:
-            logger.debug(f"[ASYNC] 更新下载进度: {self._download_progress}% -> {clamped_progress}%")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ASYNC] 更新下载进度: %d%% -> %d%%", self._download_progress, clamped_progress)
             self._download_progress = clamped_progress
-            self.downloadProgressChanged.emit()
+            self._notify("downloadProgressChanged")
 
     @Slot(str)
     def set_download_tool_name(self, tool_name: str):
         """设置下载工具名称。"""
         if tool_name != self._download_tool_name:
             self._download_tool_name = tool_name
-            self.downloadToolNameChanged.emit()
+            self._notify("downloadToolNameChanged")
 
     @Slot(str)
     def set_downloading_version(self, version: str):
         """设置正在下载的版本。"""
         if version != self._downloading_version:
             self._downloading_version = version
-            self.downloadingVersionChanged.emit()
+            self._notify("downloadingVersionChanged")
 
     @Slot(int)
     def set_downloaded_bytes(self, bytes: int):
         """设置已下载字节数。"""
         if bytes != self._downloaded_bytes:
             self._downloaded_bytes = bytes
-            self.downloadedBytesChanged.emit()
+            self._formatted_downloaded = _format_size(bytes)
+            self._notify("downloadedBytesChanged")
 
     @Slot(int)
     def set_total_bytes(self, bytes: int):
         """设置总字节数。"""
         if bytes != self._total_bytes:
             self._total_bytes = bytes
-            self.totalBytesChanged.emit()
+            self._formatted_total = _format_size(bytes)
+            self._notify("totalBytesChanged")
+
+    @Slot(object)
+    def apply_download_state(self, state: DownloadState):
+        """
+        合并后台线程发送的下载状态，仅对发生变化的字段发出通知信号。
+        
+        参数:
+            state: 下载状态更新
+        """
+        if state.message is not None:
+            self._set_message(state.message)
+        if state.progress is not None:
+            self.set_download_progress(state.progress)
+        if state.tool is not None:
+            self.set_download_tool_name(state.tool)
+        if state.version is not None:
+            self.set_downloading_version(state.version)
+        if state.downloaded is not None:
+            self.set_downloaded_bytes(state.downloaded)
+        if state.total is not None:
+            self.set_total_bytes(state.total)
+        if state.complete:
+            self.set_download_complete()
+            self.downloadCompleted.emit(state.success)
+            logger.debug(f"[ASYNC] 已发送 downloadCompleted 信号，结果: {state.success}")
+
+    @Slot()
+    def _flush_progress(self):
+        """将后台线程记录的最新下载进度刷新到属性（仅在变化时发出信号）。"""
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is None:
+            return
+        downloaded, total = pending
+        self.set_download_progress(downloaded * 100 // total if total > 0 else 0)
+        self.set_downloaded_bytes(downloaded)
+        self.set_total_bytes(total)
 
     @Slot()
     def set_download_complete(self):
         """设置下载完成。"""
+        self._progress_timer.stop()
+        self._flush_progress()
         if self._download_in_progress:
             logger.debug("[ASYNC] 设置 downloadInProgress 为 false")
             self._download_in_progress = False
-            self.downloadInProgressChanged.emit()
+            self._notify("downloadInProgressChanged")
 
-    def load_remote_versions_async(self, tool: str):
-        """异步加载远程可用版本列表。"""
+    @Slot(str)
+    def load_remote_versions_async(self, tool: str, use_cache: bool = True):
+        """
+        异步加载远程可用版本列表。
+        
+        参数:
+            tool: 工具名称
+            use_cache: 是否使用已缓存的加载结果，手动刷新时为 False
+        """
         if not tool:
             logger.warning("[ASYNC] load_remote_versions_async: 工具名称为空，跳过加载")
             return
         
+        with self._remote_cache_lock:
+            cached = self._remote_cache.get(tool) if use_cache else None
+        if cached is not None and time.monotonic() - cached[0] < self.REMOTE_CACHE_TTL_S:
+            logger.debug(f"[ASYNC] 命中 {tool} 的远程版本缓存，跳过后台加载")
+            QTimer.singleShot(0, lambda: self.remoteVersionsReady.emit(tool))
+            return
+        
+        with self._inflight_lock:
+            if tool in self._inflight:
+                logger.debug(f"[ASYNC] {tool} 的远程版本加载任务已在进行中，合并本次请求")
+                return
+            self._inflight.add(tool)
+        
         logger.info(f"[ASYNC] 启动异步加载 {tool} 的远程版本任务")
         runnable = RemoteVersionsLoader(self, tool, self._version_manager)
-        self._thread_pool.start(runnable)
+        self._meta_pool.start(runnable)
         logger.debug(f"[ASYNC] 已将 {tool} 的远程版本加载任务提交到线程池")
 
-    @Slot(int, result=str)
-    def format_file_size(self, bytes: int) -> str:
-        """格式化文件大小。"""
-        if bytes <= 0:
-            return "0 B"
-        
-        kb = 1024
-        mb = kb * 1024
-        gb = mb * 1024
+    def prefetch_all_async(self, tools: List[str]):
+        """异步预取所有工具的本地和远程版本信息。"""
+        if not tools:
+            return
         
-        if bytes < kb:
-            return f"{bytes} B"
-        elif bytes < mb:
-            return f"{bytes / kb:.2f} KB"
-        elif bytes < gb:
-            return f"{bytes / mb:.2f} MB"
-        else:
-            return f"{bytes / gb:.2f} GB"
+        logger.info(f"[ASYNC] 启动版本信息预取任务: {tools}")
+        runnable = VersionsPrefetcher(list(tools), self._version_manager)
+        self._meta_pool.start(runnable)
 
     def download_version(
         self,
@@ -438,20 +593,22 @@ class AsyncTaskManager(QObject):
     ):
         """异步下载并安装指定版本。"""
         logger.info(f"[ASYNC] 开始异步下载 {tool} 版本 {version}")
+        # 界面中所有下载相关绑定都以 downloadInProgress 为前提，
+        # 因此只需发出该信号即可让它们重新读取已重置的属性。
         self._download_progress = 0
-        self.downloadProgressChanged.emit()
-        self._download_in_progress = True
-        self.downloadInProgressChanged.emit()
         self._download_tool_name = ""
-        self.downloadToolNameChanged.emit()
         self._downloading_version = ""
-        self.downloadingVersionChanged.emit()
         self._downloaded_bytes = 0
-        self.downloadedBytesChanged.emit()
+        self._formatted_downloaded = _format_size(0)
         self._total_bytes = 0
-        self.totalBytesChanged.emit()
+        self._formatted_total = _format_size(0)
+        self._download_in_progress = True
+        self._notify("downloadInProgressChanged")
         logger.debug("[ASYNC] 重置下载进度为 0%，设置 downloadInProgress 为 true，重置下载相关属性")
         
+        self._pending_progress = None
+        self._progress_timer.start()
+        
         runnable = Downloader(self, tool, version, version_info, self._version_manager)
-        self._thread_pool.start(runnable)
+        self._download_pool.start(runnable)
         logger.debug(f"[ASYNC] 已将 {tool} 版本 {version} 的下载任务提交到线程池")
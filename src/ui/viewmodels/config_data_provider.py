@@ -5,15 +5,60 @@
 """
 
 import json
-from typing import Dict, Any
+import logging
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from PySide6.QtCore import QObject, Signal, Property
 
 from src.core.config_manager import ConfigManager
 from src.utils.logger import get_logger
 from src.utils.input_validator import InputValidator, InputValidationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
+# 工具名称来自很小的固定集合，缓存验证通过的结果；验证失败时抛出异常，不会被缓存。
+_validate_tool_name = lru_cache(maxsize=64)(InputValidator.validate_tool_name)
+
+
+def _dumps(data: Any) -> str:
+    """
+    将数据序列化为缩进 2 格、保留非 ASCII 字符的 JSON 字符串。
+    
+    安装了 orjson 时使用 orjson，否则使用标准库 json。
+    
+    参数:
+        data: 要序列化的数据
+        
+    返回:
+        JSON 字符串
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _loads(text: str) -> Any:
+    """
+    解析 JSON 字符串。
+    
+    参数:
+        text: JSON 字符串
+        
+    返回:
+        解析后的数据
+        
+    抛出:
+        json.JSONDecodeError: JSON 格式无效（orjson.JSONDecodeError 为其子类）
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class ConfigDataProvider(QObject):
     """
@@ -36,6 +81,7 @@ class ConfigDataProvider(QObject):
         super().__init__(parent)
         self._config_manager = config_manager
         self._config_json: str = ""
+        self._settings_json_cache: Optional[Tuple[int, str]] = None
         logger.info("[CONFIG_DATA] __init__(): ConfigDataProvider 初始化完成")
 
     @Property(str, notify=configJsonChanged)
@@ -52,28 +98,40 @@ class ConfigDataProvider(QObject):
             logger.info(f"[CONFIG_DATA] configJson 变更: 旧值长度={len(old_value)}, 新值长度={len(value)}")
             self.configJsonChanged.emit()
 
+    def _publish_json(self, data: Any, text: Optional[str] = None) -> None:
+        """
+        将配置数据序列化为 configJson 并通知界面。
+        
+        QML 中的文本框是单向绑定，用户编辑不会写回 configJson，因此加载/重置时
+        即使内容未变化也必须发送信号，界面才会丢弃未保存的编辑。
+        
+        参数:
+            data: 要发布的配置数据
+            text: 已由调用方提供且解析结果为 data 的 JSON 文本，提供时直接使用而不重新序列化
+        """
+        self._config_json = text if text is not None else _dumps(data)
+        self.configJsonChanged.emit()
+
     def load_config(self):
         """加载全局配置（只返回 settings 部分）。"""
         logger.info("[CONFIG_DATA] load_config(): 开始加载全局配置")
         config = self._config_manager.get_config()
         settings = config.get("settings", {})
-        self._config_json = json.dumps(settings, indent=2, ensure_ascii=False)
-        self.configJsonChanged.emit()
+        self._publish_json(settings)
         logger.info(f"[CONFIG_DATA] load_config(): 配置加载完成，长度={len(self._config_json)}")
 
     def load_tool_specific_config(self, tool_name: str):
         """加载工具特定配置。"""
         logger.info(f"[CONFIG_DATA] load_tool_specific_config(): 开始加载工具配置，工具={repr(tool_name)}")
         tool_config = self._config_manager.get_tool_specific_config(tool_name)
-        self._config_json = json.dumps(tool_config, indent=2, ensure_ascii=False)
-        self.configJsonChanged.emit()
+        self._publish_json(tool_config)
         logger.info(f"[CONFIG_DATA] load_tool_specific_config(): 工具配置加载完成，长度={len(self._config_json)}")
 
     def save_config(self, config_json: str) -> bool:
         """保存全局配置。"""
         logger.info(f"[CONFIG_DATA] save_config(): 开始保存全局配置，配置长度={len(config_json)}")
         try:
-            new_settings = json.loads(config_json)
+            new_settings = _loads(config_json)
         except json.JSONDecodeError as e:
             logger.error(f"[CONFIG_DATA] save_config(): JSON 格式无效: {e}")
             return False
@@ -90,8 +148,7 @@ class ConfigDataProvider(QObject):
             current_config["settings"] = new_settings
             self._config_manager.save_config(current_config)
             logger.info("[CONFIG_DATA] save_config(): 全局配置保存成功")
-            self._config_json = json.dumps(new_settings, indent=2, ensure_ascii=False)
-            self.configJsonChanged.emit()
+            self._publish_json(new_settings, config_json)
             return True
         except Exception as e:
             logger.error(f"[CONFIG_DATA] save_config(): 异常: {e}", exc_info=True)
@@ -102,13 +159,13 @@ class ConfigDataProvider(QObject):
         logger.info(f"[CONFIG_DATA] save_tool_specific_config(): 开始保存工具配置，工具={repr(tool_name)}, 配置长度={len(config_json)}")
         
         try:
-            InputValidator.validate_tool_name(tool_name)
+            _validate_tool_name(tool_name)
         except InputValidationError as e:
             logger.error(f"[CONFIG_DATA] save_tool_specific_config(): 工具名称验证失败: {e}")
             return False
 
         try:
-            tool_config = json.loads(config_json)
+            tool_config = _loads(config_json)
         except json.JSONDecodeError as e:
             logger.error(f"[CONFIG_DATA] save_tool_specific_config(): JSON 格式无效: {e}")
             return False
@@ -116,8 +173,7 @@ class ConfigDataProvider(QObject):
         try:
             if self._config_manager.save_tool_specific_config(tool_name, tool_config):
                 logger.info(f"[CONFIG_DATA] save_tool_specific_config(): 工具 {repr(tool_name)} 配置保存成功")
-                self._config_json = json.dumps(tool_config, indent=2, ensure_ascii=False)
-                self.configJsonChanged.emit()
+                self._publish_json(tool_config, config_json)
                 return True
             else:
                 logger.error(f"[CONFIG_DATA] save_tool_specific_config(): 工具 {repr(tool_name)} 配置保存失败")
@@ -131,8 +187,7 @@ class ConfigDataProvider(QObject):
         logger.info("[CONFIG_DATA] reset_to_default(): 开始重置配置为默认值")
         default_config = self._config_manager.reset_to_default()
         default_settings = default_config.get("settings", {})
-        self._config_json = json.dumps(default_settings, indent=2, ensure_ascii=False)
-        self.configJsonChanged.emit()
+        self._publish_json(default_settings)
         logger.info("[CONFIG_DATA] reset_to_default(): 配置已重置为默认值")
         return default_config
 
@@ -140,16 +195,21 @@ class ConfigDataProvider(QObject):
         """获取 settings 字段的配置 JSON 字符串。"""
         logger.debug("[CONFIG_DATA] get_tool_config_json(): 开始获取工具配置 JSON")
         config = self._config_manager.get_config()
-        settings = config.get("settings", {})
-        result = json.dumps(settings, indent=2, ensure_ascii=False)
-        logger.debug(f"[CONFIG_DATA] get_tool_config_json(): 获取完成，配置长度={len(result)}")
+        # 配置的加载和保存都会递增 config_version，版本号未变时直接复用上次的序列化结果
+        config_version = self._config_manager.config_version
+        if self._settings_json_cache is not None and self._settings_json_cache[0] == config_version:
+            return self._settings_json_cache[1]
+        result = _dumps(config.get("settings", {}))
+        self._settings_json_cache = (config_version, result)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CONFIG_DATA] get_tool_config_json(): 获取完成，配置长度=%d", len(result))
         return result
 
     def set_tool_root(self, tool: str, path: str) -> bool:
         """设置工具根目录。"""
         logger.info(f"[CONFIG_DATA] set_tool_root(): 开始设置工具根目录，工具={repr(tool)}, 路径={repr(path)}")
         try:
-            InputValidator.validate_tool_name(tool)
+            _validate_tool_name(tool)
             if path:
                 InputValidator.validate_path(path)
         except InputValidationError as e:
@@ -164,21 +224,23 @@ class ConfigDataProvider(QObject):
 
     def get_tool_root(self, tool: str) -> str:
         """获取工具根目录。"""
-        logger.debug(f"[CONFIG_DATA] get_tool_root(): 开始获取工具根目录，工具={repr(tool)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CONFIG_DATA] get_tool_root(): 开始获取工具根目录，工具=%r", tool)
         try:
-            InputValidator.validate_tool_name(tool)
+            _validate_tool_name(tool)
         except InputValidationError as e:
             logger.error(f"[CONFIG_DATA] get_tool_root(): 参数验证失败: {e}")
             return ""
         result = self._config_manager.get_tool_root(tool)
-        logger.debug(f"[CONFIG_DATA] get_tool_root(): 工具 {repr(tool)} 根目录={repr(result)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CONFIG_DATA] get_tool_root(): 工具 %r 根目录=%r", tool, result)
         return result
 
     def add_tool_config(self, tool_name: str) -> bool:
         """添加新工具配置。"""
         logger.info(f"[CONFIG_DATA] add_tool_config(): 开始添加工具配置，工具={repr(tool_name)}")
         try:
-            InputValidator.validate_tool_name(tool_name)
+            _validate_tool_name(tool_name)
         except InputValidationError as e:
             logger.error(f"[CONFIG_DATA] add_tool_config(): 参数验证失败: {e}")
             return False
@@ -193,7 +255,7 @@ class ConfigDataProvider(QObject):
         """删除工具配置。"""
         logger.info(f"[CONFIG_DATA] delete_tool_config(): 开始删除工具配置，工具={repr(tool_name)}")
         try:
-            InputValidator.validate_tool_name(tool_name)
+            _validate_tool_name(tool_name)
         except InputValidationError as e:
             logger.error(f"[CONFIG_DATA] delete_tool_config(): 参数验证失败: {e}")
             return False
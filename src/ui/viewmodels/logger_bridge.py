@@ -30,7 +30,7 @@ class LoggerBridge(QObject):
         参数:
             message: 日志消息
         """
-        logger.info(f"[QML] {message}")
+        logger.info("[QML] %s", message)
 
     @Slot(str)
     def logDebug(self, message: str):
@@ -40,7 +40,7 @@ class LoggerBridge(QObject):
         参数:
             message: 日志消息
         """
-        logger.debug(f"[QML] {message}")
+        logger.debug("[QML] %s", message)
 
     @Slot(str)
     def logWarning(self, message: str):
@@ -50,7 +50,7 @@ class LoggerBridge(QObject):
         参数:
             message: 日志消息
         """
-        logger.warning(f"[QML] {message}")
+        logger.warning("[QML] %s", message)
 
     @Slot(str)
     def logError(self, message: str):
@@ -60,4 +60,4 @@ class LoggerBridge(QObject):
         参数:
             message: 日志消息
         """
-        logger.error(f"[QML] {message}")
+        logger.error("[QML] %s", message)
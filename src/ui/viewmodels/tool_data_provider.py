@@ -4,8 +4,11 @@
 负责工具和版本数据的管理，包括工具列表、已安装版本、远程版本等。
 """
 
-from typing import List, Dict, Any, Optional
-from PySide6.QtCore import QObject, Signal, Property
+import logging
+from contextlib import contextmanager
+from itertools import chain
+from typing import List, Dict, Any, Optional, Iterator
+from PySide6.QtCore import QObject, Signal, Property, Slot, QTimer
 
 from src.core.config_manager import ConfigManager
 from src.core.version_manager import VersionManager
@@ -29,6 +32,14 @@ class ToolDataProvider(QObject):
     currentVersionChanged = Signal()
     remoteVersionsLoadingChanged = Signal()
 
+    DEBOUNCE_INTERVAL_MS = 50
+    _DEBOUNCED_SIGNALS = frozenset({
+        "toolsChanged",
+        "installedVersionsChanged",
+        "remoteVersionsChanged",
+        "groupedRemoteVersionsChanged",
+    })
+
     def __init__(
         self,
         config_manager: ConfigManager,
@@ -48,26 +59,95 @@ class ToolDataProvider(QObject):
         self._config_manager = config_manager
         self._version_manager = version_manager
         self._tools: List[Dict[str, str]] = []
+        self._tools_config_version: Optional[int] = None
         self._current_tool: str = ""
         self._installed_versions: List[Dict[str, str]] = []
         self._remote_versions: List[Dict[str, str]] = []
         self._grouped_remote_versions: List[Dict[str, Any]] = []
         self._current_version: str = ""
         self._remote_versions_loading: bool = False
+        self._batch_depth: int = 0
+        self._pending_signals: Dict[str, None] = {}
+        self._debounced_signals: Dict[str, None] = {}
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_INTERVAL_MS)
+        self._debounce_timer.timeout.connect(self._flush_debounced)
         logger.debug("[TOOL_DATA] 开始加载工具列表")
         self._load_tools()
         logger.info("[TOOL_DATA] ToolDataProvider 初始化完成")
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        批量更新上下文管理器。
+        
+        上下文中的属性变更信号会被合并，退出最外层上下文时每个信号只发送一次。
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_signals:
+                pending = list(self._pending_signals)
+                self._pending_signals.clear()
+                for name in pending:
+                    self._emit(name)
+
+    def _notify(self, name: str):
+        """
+        发送属性变更信号，批量更新期间延迟到批量结束时发送。
+        
+        参数:
+            name: 信号名称
+        """
+        if self._batch_depth:
+            self._pending_signals[name] = None
+        else:
+            self._emit(name)
+
+    def _emit(self, name: str):
+        """
+        发送属性变更信号。
+        
+        列表类属性的信号经防抖处理：在 DEBOUNCE_INTERVAL_MS 内的连续变更只发送一次，
+        属性值本身始终同步更新。
+        
+        参数:
+            name: 信号名称
+        """
+        if name in self._DEBOUNCED_SIGNALS:
+            self._debounced_signals[name] = None
+            self._debounce_timer.start()
+        else:
+            getattr(self, name).emit()
+
+    @Slot()
+    def _flush_debounced(self):
+        """发送防抖期间积累的列表属性变更信号。"""
+        pending, self._debounced_signals = self._debounced_signals, {}
+        for name in pending:
+            getattr(self, name).emit()
+
     def _load_tools(self):
-        """加载工具列表。"""
+        """加载工具列表，配置未变化时跳过重建。"""
+        if self._config_manager.config_version == self._tools_config_version:
+            logger.debug("[TOOL_DATA] 配置未变化，跳过重建工具列表")
+            return
+        
         tool_templates = self._config_manager.get_tool_templates()
-        logger.info(f"[TOOL_DATA] 加载工具模板，数量: {len(tool_templates)}")
+        self._tools_config_version = self._config_manager.config_version
+        logger.info("[TOOL_DATA] 加载工具模板，数量: %d", len(tool_templates))
         
-        self._tools = [{"name": name, "path": template.get("tool_root", "")} 
-                       for name, template in tool_templates.items()]
+        tools = [{"name": name, "path": template.get("tool_root", "")} 
+                 for name, template in tool_templates.items()]
+        if tools == self._tools:
+            return
         
-        logger.info(f"[TOOL_DATA] 构建的工具列表: {self._tools}")
-        self.toolsChanged.emit()
+        self._tools = tools
+        logger.info("[TOOL_DATA] 构建的工具列表: %s", self._tools)
+        self._notify("toolsChanged")
 
     @Property(list, notify=toolsChanged)
     def tools(self) -> List[Dict[str, str]]:
@@ -85,8 +165,9 @@ class ToolDataProvider(QObject):
         if self._current_tool != value:
             old_value = self._current_tool
             self._current_tool = value
-            logger.info(f"[TOOL_DATA] currentTool 变更: 旧值={repr(old_value)}, 新值={repr(value)}")
-            self.currentToolChanged.emit()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[TOOL_DATA] currentTool 变更: 旧值=%r, 新值=%r", old_value, value)
+            self._notify("currentToolChanged")
 
     @Property(list, notify=installedVersionsChanged)
     def installedVersions(self) -> List[Dict[str, str]]:
@@ -114,8 +195,9 @@ class ToolDataProvider(QObject):
         if self._current_version != value:
             old_value = self._current_version
             self._current_version = value
-            logger.info(f"[TOOL_DATA] currentVersion 变更: 旧值={repr(old_value)}, 新值={repr(value)}")
-            self.currentVersionChanged.emit()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[TOOL_DATA] currentVersion 变更: 旧值=%r, 新值=%r", old_value, value)
+            self._notify("currentVersionChanged")
 
     @Property(bool, notify=remoteVersionsLoadingChanged)
     def remoteVersionsLoading(self) -> bool:
@@ -128,18 +210,19 @@ class ToolDataProvider(QObject):
         if self._remote_versions_loading != value:
             old_value = self._remote_versions_loading
             self._remote_versions_loading = value
-            logger.info(f"[TOOL_DATA] remoteVersionsLoading 变更: 旧值={old_value}, 新值={value}")
-            self.remoteVersionsLoadingChanged.emit()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[TOOL_DATA] remoteVersionsLoading 变更: 旧值=%s, 新值=%s", old_value, value)
+            self._notify("remoteVersionsLoadingChanged")
 
     def load_tool_data(self):
         """加载当前工具的数据。"""
         if not self._current_tool:
             logger.debug("[TOOL_DATA] load_tool_data(): 当前工具为空，跳过加载")
             return
-        logger.info(f"[TOOL_DATA] load_tool_data(): 开始加载工具数据，工具={repr(self._current_tool)}")
+        logger.info("[TOOL_DATA] load_tool_data(): 开始加载工具数据，工具=%r", self._current_tool)
         self._version_manager.check_and_update_system_version(self._current_tool)
         installed = self._version_manager.scan_local_versions(self._current_tool)
-        self._installed_versions = [
+        installed_versions = [
             {
                 "version": v["version"], 
                 "path": v["path"],
@@ -148,36 +231,40 @@ class ToolDataProvider(QObject):
             }
             for v in installed
         ]
-        self.installedVersionsChanged.emit()
-        logger.info(f"[TOOL_DATA] load_tool_data(): 已安装版本数量={len(self._installed_versions)}")
-        current = self._version_manager.get_current_version(self._current_tool)
-        self._current_version = current or ""
-        self.currentVersionChanged.emit()
-        logger.info(f"[TOOL_DATA] load_tool_data(): 当前版本={repr(self._current_version)}")
+        current_version = self._version_manager.get_current_version(self._current_tool) or ""
+        # 内容未变化时不发送信号，避免 QML 重新查询属性并重建列表
+        with self.batch_updates():
+            if installed_versions != self._installed_versions:
+                self._installed_versions = installed_versions
+                self._notify("installedVersionsChanged")
+            if current_version != self._current_version:
+                self._current_version = current_version
+                self._notify("currentVersionChanged")
+        logger.info("[TOOL_DATA] load_tool_data(): 已安装版本数量=%d", len(self._installed_versions))
+        logger.info("[TOOL_DATA] load_tool_data(): 当前版本=%r", self._current_version)
 
     def update_remote_versions(self, tool: str, versions: List[Dict[str, Any]], grouped_versions: List[Dict[str, Any]]):
         """更新远程版本数据。"""
-        logger.info(f"[TOOL_DATA] update_remote_versions(): 开始更新，工具={repr(tool)}, 远程版本数量={len(versions)}, 分组数量={len(grouped_versions)}")
+        logger.info(
+            "[TOOL_DATA] update_remote_versions(): 开始更新，工具=%r, 远程版本数量=%d, 分组数量=%d",
+            tool, len(versions), len(grouped_versions),
+        )
         if tool != self._current_tool:
-            logger.debug(f"[TOOL_DATA] update_remote_versions(): 工具 {repr(tool)} 与当前工具 {repr(self._current_tool)} 不匹配，忽略")
+            logger.debug("[TOOL_DATA] update_remote_versions(): 工具 %r 与当前工具 %r 不匹配，忽略", tool, self._current_tool)
             return
         
         self._remote_versions = versions
-        logger.debug(f"[TOOL_DATA] update_remote_versions(): 更新 remoteVersions，数量={len(versions)}")
-        self.remoteVersionsChanged.emit()
-
-        installed_version_set = set()
-        for v in self._installed_versions:
-            installed_version_set.add(v.get("version", ""))
+        logger.debug("[TOOL_DATA] update_remote_versions(): 更新 remoteVersions，数量=%d", len(versions))
+        self._notify("remoteVersionsChanged")
 
-        for version in grouped_versions:
-            for v in version.get("versions", []):
-                v["isInstalled"] = v.get("version", "") in installed_version_set
+        is_installed = frozenset(v.get("version", "") for v in self._installed_versions).__contains__
+        for v in chain.from_iterable(group.get("versions", ()) for group in grouped_versions):
+            v["isInstalled"] = is_installed(v.get("version", ""))
 
         self._grouped_remote_versions = grouped_versions
-        logger.debug(f"[TOOL_DATA] update_remote_versions(): 更新 groupedRemoteVersions，数量={len(grouped_versions)}")
-        self.groupedRemoteVersionsChanged.emit()
-        logger.info(f"[TOOL_DATA] update_remote_versions(): 更新完成")
+        logger.debug("[TOOL_DATA] update_remote_versions(): 更新 groupedRemoteVersions，数量=%d", len(grouped_versions))
+        self._notify("groupedRemoteVersionsChanged")
+        logger.info("[TOOL_DATA] update_remote_versions(): 更新完成")
 
     def refresh_tools(self):
         """刷新工具列表。"""
@@ -187,7 +274,7 @@ class ToolDataProvider(QObject):
 
     def reset_current_tool(self):
         """重置当前工具为空。"""
-        logger.info(f"[TOOL_DATA] reset_current_tool(): 重置当前工具，旧值={repr(self._current_tool)}")
+        logger.info("[TOOL_DATA] reset_current_tool(): 重置当前工具，旧值=%r", self._current_tool)
         self._current_tool = ""
-        self.currentToolChanged.emit()
+        self._notify("currentToolChanged")
         logger.info("[TOOL_DATA] reset_current_tool(): 重置完成")
@@ -7,7 +7,7 @@ Mysysenv 工具模块。
 from .logger import get_logger
 from .permission_manager import is_admin
 from .retry import RetryHandler
-from .speed_limiter import SpeedLimiter
+from .speed_limiter import SpeedLimiter, ThrottledWriter
 from .download_history import DownloadHistory
 from .rate_limiter import RateLimiter
 from .input_validator import InputValidator, InputValidationError
@@ -17,6 +17,7 @@ __all__ = [
     "is_admin",
     "RetryHandler",
     "SpeedLimiter",
+    "ThrottledWriter",
     "DownloadHistory",
     "RateLimiter",
     "InputValidator",
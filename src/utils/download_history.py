@@ -6,22 +6,66 @@
 
 import os
 import json
+import threading
+from collections import defaultdict, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Deque, DefaultDict, Iterable
 
 from src.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
 
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """
+    将一条记录序列化为单行 UTF-8 JSON（以换行结尾）。
+    
+    安装了 orjson 时使用 orjson，否则使用标准库 json。
+    
+    参数:
+        record: 记录数据
+        
+    返回:
+        JSON 行字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    解析 UTF-8 JSON 字节串。
+    
+    参数:
+        raw: JSON 字节串
+        
+    返回:
+        解析后的数据
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 class DownloadHistory:
     """
     下载历史记录类。
     
-    记录下载任务的历史和状态。
+    记录下载任务的历史和状态。历史以 JSON Lines 格式追加写入文件，
+    内存中只保留最近的 MAX_RECORDS 条（最新的在前），并按工具名称维护索引。
     """
     
+    MAX_RECORDS = 100
+    COMPACT_THRESHOLD = 200
+    
     def __init__(self, config_dir: Path):
         """
         初始化下载历史记录器。
@@ -29,28 +73,121 @@ class DownloadHistory:
         参数:
             config_dir: 配置目录路径
         """
-        self.history_file = config_dir / "download_history.json"
-        self.history: List[Dict[str, Any]] = []
+        self.history_file = config_dir / "download_history.jsonl"
+        self._legacy_file = config_dir / "download_history.json"
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_RECORDS)
+        self._by_tool: DefaultDict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._line_count = 0
+        self._lock = threading.Lock()
+        self._saved_fingerprint: Optional[int] = None
         self._load_history()
+        self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """根据内存中的历史记录重建按工具名称的索引。"""
+        self._by_tool.clear()
+        for record in self.history:
+            self._by_tool[record.get("tool")].append(record)
     
     def _load_history(self) -> None:
-        """加载历史记录文件。"""
+        """加载历史记录文件，并迁移旧版整文件 JSON 格式的历史。"""
         if self.history_file.exists():
             try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    self.history = json.load(f)
+                lines = self.history_file.read_bytes().splitlines()
+            except Exception as e:
+                logger.warning(f"加载下载历史失败: {e}")
+                return
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    self.history.appendleft(_loads(line))
+                except Exception as e:
+                    logger.warning(f"跳过无法解析的下载历史记录: {e}")
+            self._line_count = len(lines)
+        elif self._legacy_file.exists():
+            try:
+                records = _loads(self._legacy_file.read_bytes())
             except Exception as e:
                 logger.warning(f"加载下载历史失败: {e}")
-                self.history = []
+                return
+            if not isinstance(records, list):
+                logger.warning(f"加载下载历史失败: 旧版历史文件格式无效（{type(records).__name__}）")
+                return
+            self.history.extend([r for r in records if isinstance(r, dict)][:self.MAX_RECORDS])
+            self._save_history()
+            try:
+                self._legacy_file.unlink()
+            except OSError as e:
+                logger.warning(f"删除旧版下载历史文件失败: {e}")
+    
+    def _fingerprint(self) -> int:
+        """计算内存中历史记录的指纹，用于判断文件是否需要重写。"""
+        return hash(tuple(
+            (r.get("tool"), r.get("version"), r.get("status"), r.get("timestamp"))
+            for r in self.history
+        ))
     
     def _save_history(self) -> None:
-        """保存历史记录到文件。"""
+        """
+        将内存中的历史记录完整重写到文件（按时间从旧到新）。
+        
+        先写入临时文件再原子替换，避免写入中断导致文件损坏；
+        文件内容与内存一致时跳过写入。
+        """
+        fingerprint = self._fingerprint()
+        if self._line_count == len(self.history) and fingerprint == self._saved_fingerprint:
+            return
+        
+        temp_path = self.history_file.with_suffix(self.history_file.suffix + ".tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(b"".join(_dumps_line(r) for r in reversed(self.history)))
+            os.replace(temp_path, self.history_file)
+            self._line_count = len(self.history)
+            self._saved_fingerprint = fingerprint
+        except Exception as e:
+            logger.warning(f"保存下载历史失败: {e}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+    
+    def _append_history(self, *records: Dict[str, Any]) -> None:
+        """
+        将记录追加到文件末尾，文件行数超过阈值时压缩重写。
+        
+        参数:
+            *records: 记录数据（按时间从旧到新）
+        """
+        if self._line_count >= self.COMPACT_THRESHOLD:
+            self._save_history()
+            return
         try:
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+            with open(self.history_file, "ab") as f:
+                f.write(b"".join(_dumps_line(r) for r in records))
+            self._line_count += len(records)
         except Exception as e:
             logger.warning(f"保存下载历史失败: {e}")
     
+    def _insert(self, record: Dict[str, Any]) -> None:
+        """
+        将记录插入内存历史和按工具名称的索引。
+        
+        参数:
+            record: 记录数据
+        """
+        if len(self.history) == self.MAX_RECORDS:
+            # 最旧的记录即将被挤出，同步从所属工具的索引末尾移除
+            evicted = self.history[-1]
+            tool_records = self._by_tool[evicted.get("tool")]
+            tool_records.pop()
+            if not tool_records:
+                del self._by_tool[evicted.get("tool")]
+        
+        self.history.appendleft(record)
+        self._by_tool[record.get("tool")].appendleft(record)
+    
     def add_record(
         self,
         tool: str,
@@ -78,14 +215,28 @@ class DownloadHistory:
             "download_url": download_url
         }
         
-        self.history.insert(0, record)
-        
-        if len(self.history) > 100:
-            self.history = self.history[:100]
-        
-        self._save_history()
+        # 下载线程可能并发添加记录，插入（含淘汰与索引维护）和写文件需整体加锁
+        with self._lock:
+            self._insert(record)
+            self._append_history(record)
         logger.info(f"记录下载历史: {tool} {version} - {status}")
     
+    def batch_add(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        批量添加下载记录，所有记录只写入文件一次。
+        
+        参数:
+            records: 记录数据（按时间从旧到新，字段与 add_record 生成的记录一致）
+        """
+        records = list(records)
+        if not records:
+            return
+        with self._lock:
+            for record in records:
+                self._insert(record)
+            self._append_history(*records)
+        logger.info(f"批量记录下载历史: {len(records)} 条")
+    
     def get_history(self, tool: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """
         获取下载历史记录。
@@ -97,13 +248,15 @@ class DownloadHistory:
         返回:
             下载历史记录列表
         """
-        if tool:
-            filtered = [r for r in self.history if r.get("tool") == tool]
-            return filtered[:limit]
-        return self.history[:limit]
+        with self._lock:
+            if tool:
+                return list(islice(self._by_tool.get(tool, ()), limit))
+            return list(islice(self.history, limit))
     
     def clear_history(self) -> None:
         """清空历史记录。"""
-        self.history = []
-        self._save_history()
+        with self._lock:
+            self.history.clear()
+            self._by_tool.clear()
+            self._save_history()
         logger.info("清空下载历史")
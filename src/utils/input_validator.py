@@ -4,8 +4,9 @@
 提供用户输入的验证和 sanitization 功能。
 """
 
-import os
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from src.utils.logger import get_logger
@@ -13,6 +14,20 @@ from src.utils.logger import get_logger
 logger = get_logger()
 
 
+@lru_cache(maxsize=256)
+def _split_config_key(key: str) -> tuple:
+    """
+    将点号分隔的配置键拆分为各级键名（按键字符串缓存）。
+    
+    参数:
+        key: 点号分隔的键名
+        
+    返回:
+        各级键名组成的元组
+    """
+    return tuple(key.split('.'))
+
+
 class InputValidationError(Exception):
     """输入验证错误异常。"""
     pass
@@ -25,7 +40,21 @@ class InputValidator:
     提供用户输入的验证和 sanitization 功能。
     """
     
-    TOOL_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    TOOL_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+    VERSION_CHARS = TOOL_NAME_CHARS | {'.'}
+    URL_PATTERN = re.compile(
+        r'^https?://'
+        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
+        r'(?:[A-Z]{2,63}|[A-Z0-9-]{2,})|'
+        r'localhost|'
+        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+        r'(?::\d+)?'
+        r'(?:/?|[/?]\S+)$',
+        re.IGNORECASE
+    )
+    COMMAND_DANGEROUS_CHARS = (';', '|', '&', '>', '<', '`', '$', '\\', '"', "'")
+    _COMMAND_DANGER_SET = frozenset(COMMAND_DANGEROUS_CHARS)
+    _FILENAME_DELETE_TABLE = str.maketrans("", "", '<>:"/\\|?*')
     MAX_TOOL_NAME_LENGTH = 50
     MAX_PATH_LENGTH = 1024
     MAX_VERSION_LENGTH = 100
@@ -49,7 +78,7 @@ class InputValidator:
         if len(tool_name) > cls.MAX_TOOL_NAME_LENGTH:
             raise InputValidationError(f"工具名称不能超过 {cls.MAX_TOOL_NAME_LENGTH} 个字符")
         
-        if not cls.TOOL_NAME_PATTERN.match(tool_name):
+        if not cls.TOOL_NAME_CHARS.issuperset(tool_name):
             raise InputValidationError("工具名称只能包含字母、数字、下划线和连字符")
         
         return True
@@ -107,11 +136,11 @@ class InputValidator:
         抛出:
             InputValidationError: 如果结果路径不在 base_path 外部
         """
-        base = os.path.abspath(base_path)
-        joined = os.path.abspath(os.path.join(base, *paths))
-        if not joined.startswith(base + os.sep):
+        base = Path(base_path).resolve()
+        joined = base.joinpath(*paths).resolve()
+        if not joined.is_relative_to(base):
             raise InputValidationError(f"路径遍历检测: {joined}")
-        return joined
+        return str(joined)
     
     @classmethod
     def validate_json_config(cls, config_data: Dict[str, Any]) -> bool:
@@ -161,14 +190,14 @@ class InputValidator:
         返回:
             验证通过返回 True，否则抛出 InputValidationError
         """
-        if not version or not version.strip():
+        version = version.strip() if version else ""
+        if not version:
             raise InputValidationError("版本号不能为空")
         
-        if len(version.strip()) > cls.MAX_VERSION_LENGTH:
+        if len(version) > cls.MAX_VERSION_LENGTH:
             raise InputValidationError(f"版本号不能超过 {cls.MAX_VERSION_LENGTH} 个字符")
         
-        version_pattern = re.compile(r'^[a-zA-Z0-9._-]+$')
-        if not version_pattern.match(version.strip()):
+        if not cls.VERSION_CHARS.issuperset(version):
             raise InputValidationError("版本号格式无效")
         
         return True
@@ -199,19 +228,11 @@ class InputValidator:
         返回:
             验证通过返回 True，否则抛出 InputValidationError
         """
-        if not url or not url.strip():
+        url = url.strip() if url else ""
+        if not url:
             return True
         
-        url_pattern = re.compile(
-            r'^https?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+'
-            r'(?:[A-Z]{2,63}|[A-Z0-9-]{2,})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$',
-            re.IGNORECASE
-        )
-        
-        if not url_pattern.match(url.strip()):
+        if not cls.URL_PATTERN.match(url):
             raise InputValidationError("URL 格式无效")
         
         return True
@@ -245,9 +266,11 @@ class InputValidator:
             配置值或默认值
         """
         try:
-            keys = key.split('.')
+            if '.' not in key:
+                return config.get(key, default) if isinstance(config, dict) else default
+            
             value = config
-            for k in keys:
+            for k in _split_config_key(key):
                 if isinstance(value, dict):
                     value = value.get(k, default)
                 else:
@@ -274,10 +297,9 @@ class InputValidator:
         if len(arg) > max_length:
             raise InputValidationError(f"命令参数超过最大长度")
         
-        dangerous_chars = [';', '|', '&', '>', '<', '`', '$', '\\', '"', "'"]
-        for char in dangerous_chars:
-            if char in arg:
-                raise InputValidationError(f"命令参数包含非法字符: {char}")
+        if not cls._COMMAND_DANGER_SET.isdisjoint(arg):
+            char = next(c for c in cls.COMMAND_DANGEROUS_CHARS if c in arg)
+            raise InputValidationError(f"命令参数包含非法字符: {char}")
         
         return True
     
@@ -295,10 +317,7 @@ class InputValidator:
         if not filename:
             return ""
         
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = ''.join(c for c in filename if c not in invalid_chars)
-        
-        sanitized = sanitized.strip()
+        sanitized = filename.translate(cls._FILENAME_DELETE_TABLE).strip()
         
         if sanitized in ['', '.', '..']:
             return "invalid_filename"
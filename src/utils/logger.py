@@ -4,14 +4,17 @@
 提供应用程序日志的配置和管理功能。
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 _logger: Optional[logging.Logger] = None
+_listener: Optional[QueueListener] = None
 
 
 def get_app_dir() -> Path:
@@ -57,7 +60,7 @@ def setup_logger(
     返回:
         配置好的 Logger 实例
     """
-    global _logger
+    global _logger, _listener
 
     if _logger is not None:
         return _logger
@@ -67,6 +70,7 @@ def setup_logger(
     logger.handlers.clear()
 
     formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    handlers = []
 
     if log_to_file:
         target_dir = log_dir or LOG_DIR
@@ -80,18 +84,37 @@ def setup_logger(
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # 实际的文件/控制台写入由后台线程完成，调用方只需把记录放入队列
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logger)
 
     _logger = logger
     return logger
 
 
+def shutdown_logger() -> None:
+    """
+    停止后台日志线程，并写出队列中剩余的日志记录。
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger() -> logging.Logger:
     """
     获取日志记录器实例。
@@ -117,3 +140,6 @@ def set_log_level(level: int) -> None:
     logger.setLevel(level)
     for handler in logger.handlers:
         handler.setLevel(level)
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.setLevel(level)
@@ -1,12 +1,16 @@
 import ctypes
 import sys
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def is_admin() -> bool:
     """
     检测当前进程是否具有管理员权限。
     
+    进程的权限在运行期间不会改变，结果只查询一次。
+    
     Returns:
         bool: 如果具有管理员权限返回 True，否则返回 False
     """
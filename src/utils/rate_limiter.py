@@ -34,13 +34,13 @@ class RateLimiter:
         """
         self.min_interval = min_interval
         self.last_request_time = 0.0
-        self._lock = threading.Lock()
+        self._lock = threading.Condition()
 
         self.requests_per_second = requests_per_second
         if requests_per_second is not None:
             self.tokens = float(max_tokens or requests_per_second)
             self.max_tokens = float(max_tokens or requests_per_second)
-            self.last_token_refill_time = time.time()
+            self.last_token_refill_time = time.monotonic()
         else:
             self.tokens = None
             self.max_tokens = None
@@ -53,35 +53,31 @@ class RateLimiter:
         此方法会阻塞直到可以发送请求。
         """
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
 
             if self.requests_per_second is not None:
                 self._refill_tokens(now)
-
-                while self.tokens < 1.0:
-                    wait_time = (1.0 - self.tokens) / self.requests_per_second
-                    time.sleep(wait_time)
-                    now = time.time()
-                    self._refill_tokens(now)
-
+                # 先预留 token（余额可为负），不足部分按速率一次算出等待时间
                 self.tokens -= 1.0
+                wait_time = -self.tokens / self.requests_per_second
+            else:
+                wait_time = self.last_request_time + self.min_interval - now
+
+            if wait_time <= 0:
                 self.last_request_time = now
+                return
 
-            else:
-                time_since_last = now - self.last_request_time
-                if time_since_last < self.min_interval:
-                    wait_time = self.min_interval - time_since_last
-                    time.sleep(wait_time)
-                    self.last_request_time = time.time()
-                else:
-                    self.last_request_time = now
+            # 预约发送时刻，后续调用者据此排队，无需醒来后重新检查
+            self.last_request_time = now + wait_time
+            # 等待期间释放锁；reset() 会提前唤醒等待者
+            self._lock.wait(wait_time)
 
     def _refill_tokens(self, now: float) -> None:
         """
         补充 Token Bucket 中的 token。
 
         参数:
-            now: 当前时间戳
+            now: 当前单调时钟时间
         """
         if self.last_token_refill_time is None:
             return
@@ -99,4 +95,5 @@ class RateLimiter:
             self.last_request_time = 0.0
             if self.requests_per_second is not None:
                 self.tokens = self.max_tokens
-                self.last_token_refill_time = time.time()
+                self.last_token_refill_time = time.monotonic()
+            self._lock.notify_all()
@@ -9,6 +9,8 @@ import random
 from typing import Callable, TypeVar, Tuple, Optional, Any
 from functools import wraps
 
+import requests
+
 from src.utils.logger import get_logger
 
 logger = get_logger()
@@ -23,6 +25,14 @@ class RetryHandler:
     实现指数退避重试策略，用于处理临时性错误。
     """
     
+    RETRYABLE_EXCEPTIONS = (
+        requests.exceptions.Timeout,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.HTTPError,
+        requests.exceptions.ChunkedEncodingError,
+    )
+    RETRYABLE_STATUS_CODES = frozenset((408, 429))
+    
     def __init__(
         self,
         max_retries: int = 3,
@@ -46,6 +56,11 @@ class RetryHandler:
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
         self.jitter = jitter
+        self._delay_schedule = tuple(
+            min(base_delay * (backoff_factor ** i), max_delay)
+            for i in range(max_retries + 1)
+        )
+        self._random = random.Random()
     
     def _calculate_delay(self, attempt: int) -> float:
         """
@@ -57,11 +72,10 @@ class RetryHandler:
         返回:
             延迟时间（秒）
         """
-        delay = self.base_delay * (self.backoff_factor ** attempt)
-        delay = min(delay, self.max_delay)
+        delay = self._delay_schedule[attempt]
         
         if self.jitter:
-            delay = delay * (0.5 + random.random() * 0.5)
+            delay = delay * (0.5 + self._random.random() * 0.5)
         
         return delay
     
@@ -75,25 +89,16 @@ class RetryHandler:
         返回:
             可重试返回 True，否则返回 False
         """
-        import requests
-        
-        retryable_exceptions = (
-            requests.exceptions.Timeout,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.HTTPError,
-            requests.exceptions.ChunkedEncodingError,
-        )
+        if not isinstance(exception, self.RETRYABLE_EXCEPTIONS):
+            return False
         
-        if isinstance(exception, retryable_exceptions):
-            if isinstance(exception, requests.exceptions.HTTPError):
-                if hasattr(exception, 'response') and exception.response is not None:
-                    status_code = exception.response.status_code
-                    if status_code >= 500 or status_code in [408, 429]:
-                        return True
-                    return False
-            return True
+        if isinstance(exception, requests.exceptions.HTTPError):
+            response = getattr(exception, 'response', None)
+            if response is not None:
+                status_code = response.status_code
+                return status_code >= 500 or status_code in self.RETRYABLE_STATUS_CODES
         
-        return False
+        return True
     
     def execute(
         self,
@@ -4,59 +4,262 @@
 提供下载速度限制功能。
 """
 
+import random
+import sys
+import threading
 import time
-from typing import BinaryIO
+from typing import BinaryIO, Dict, Optional, Sequence, Union
 
-from src.utils.logger import get_logger
+BytesLike = Union[bytes, bytearray, memoryview]
 
-logger = get_logger()
+# 低于系统计时器精度的等待不调用 sleep（Windows 约 1ms）
+_MIN_SLEEP = 1e-3 if sys.platform == "win32" else 1e-4
+
+MIN_BURST = 1 << 20
+
+
+class _TokenBucket:
+    """
+    线程安全的 Token Bucket。
+    
+    token 以 rate 字节/秒的速率累积，最多累积 burst 字节。
+    """
+    
+    def __init__(self, rate: int):
+        """
+        初始化 Token Bucket。
+        
+        参数:
+            rate: 补充速率（字节/秒）
+        """
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.burst = max(rate, MIN_BURST)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+    
+    def set_rate(self, rate: int) -> None:
+        """
+        修改补充速率。
+        
+        参数:
+            rate: 补充速率（字节/秒）
+        """
+        with self._lock:
+            self.rate = rate
+            self.burst = max(rate, MIN_BURST)
+    
+    def reserve(self, size: int, _now=time.monotonic) -> float:
+        """
+        预留 token（余额可为负，欠额由后续的补充抵扣）。
+        
+        只在锁内做计算，不在锁内等待。
+        
+        参数:
+            size: 需要的 token 数（字节）
+            
+        返回:
+            调用方需要等待的秒数，不需要等待时小于等于 0
+        """
+        with self._lock:
+            now = _now()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= size
+            return -self.tokens / self.rate
+
+
+_shared_buckets: Dict[str, _TokenBucket] = {}
+_shared_buckets_lock = threading.Lock()
+
+
+def _get_shared_bucket(name: str, rate: int) -> _TokenBucket:
+    """
+    获取或注册按名称共享的进程级 Token Bucket。
+    
+    已存在时更新为最新的速率，使配置变更对所有使用者生效。
+    
+    参数:
+        name: 共享名称
+        rate: 补充速率（字节/秒）
+        
+    返回:
+        共享的 Token Bucket
+    """
+    with _shared_buckets_lock:
+        bucket = _shared_buckets.get(name)
+        if bucket is None:
+            bucket = _shared_buckets[name] = _TokenBucket(rate)
+        elif bucket.rate != rate:
+            bucket.set_rate(rate)
+        return bucket
 
 
 class SpeedLimiter:
     """
     下载速度限制器类。
     
-    实现简单的下载速度限制功能。
+    使用 Token Bucket 算法限制平均下载速度：token 以 speed_limit 字节/秒的速率
+    累积，最多累积 burst 字节；每次写入消耗与数据等量的 token，不足时才等待。
+    
+    多个下载线程可共享同一实例，共同受同一速度限制；指定 bucket_name 时，
+    同名的所有实例共享同一个进程级 Token Bucket，总速度不超过限制。
+    限速时小块数据先按文件缓冲，累积到 FLUSH_THRESHOLD 后再统一计算和写入，
+    写入结束后必须调用 flush() 写出剩余数据。
     """
     
-    def __init__(self, speed_limit_bytes: int = 0):
+    FLUSH_THRESHOLD = 64 * 1024
+    
+    def __init__(
+        self,
+        speed_limit_bytes: int = 0,
+        jitter: float = 0.0,
+        bucket_name: Optional[str] = None
+    ):
         """
         初始化速度限制器。
         
         参数:
             speed_limit_bytes: 速度限制（字节/秒），0 表示不限速
+            jitter: 等待时间的随机抖动比例（如 0.05 表示 ±5%），0 表示不抖动
+            bucket_name: 共享带宽的名称（可选），同名实例共享同一速度限制
         """
         self.speed_limit = speed_limit_bytes
-        self.last_time = time.time()
-        self.bytes_read = 0
+        self.jitter = jitter
+        self._random = random.Random()
+        self._buffers: Dict[BinaryIO, bytearray] = {}
+        self._bucket: Optional[_TokenBucket] = None
+        if speed_limit_bytes > 0:
+            if bucket_name:
+                self._bucket = _get_shared_bucket(bucket_name, speed_limit_bytes)
+            else:
+                self._bucket = _TokenBucket(speed_limit_bytes)
     
-    def write_with_limit(self, f: BinaryIO, data: bytes) -> int:
+    def write_with_limit(self, f: BinaryIO, data: BytesLike) -> int:
         """
         写入数据并应用速度限制。
         
+        限速时数据可能暂存在缓冲区中，尚未写入文件。data 可以是 bytes、
+        bytearray 或 memoryview，限速器内部不会复制为 bytes。
+        
         参数:
             f: 文件对象
             data: 要写入的数据
             
         返回:
-            实际写入的字节数
+            接受的字节数
         """
         if self.speed_limit <= 0:
             return f.write(data)
         
-        chunk_size = len(data)
-        written = f.write(data)
-        self.bytes_read += written
+        buffer = self._buffers.get(f)
+        if buffer is None:
+            buffer = self._buffers[f] = bytearray()
+        buffer += data
+        if len(buffer) >= self.FLUSH_THRESHOLD:
+            self._write_limited(f, buffer)
+            buffer.clear()
+        return len(data)
+    
+    def write_many_with_limit(self, f: BinaryIO, chunks: Sequence[BytesLike]) -> int:
+        """
+        批量写入多个数据块，只做一次限速计算和等待，并一次性写入文件。
         
-        current_time = time.time()
-        elapsed = current_time - self.last_time
+        参数:
+            f: 文件对象
+            chunks: 要写入的数据块序列
+            
+        返回:
+            写入的总字节数
+        """
+        total = sum(map(len, chunks))
+        if self.speed_limit > 0:
+            # 先写出缓冲区中的数据，保证写入顺序
+            self.flush(f)
+            self._wait(total)
+        f.writelines(chunks)
+        return total
+    
+    def flush(self, f: BinaryIO) -> None:
+        """
+        写出文件对应缓冲区中的剩余数据（仍应用速度限制）。
+        
+        参数:
+            f: 文件对象
+        """
+        buffer = self._buffers.pop(f, None)
+        if buffer:
+            self._write_limited(f, buffer)
+    
+    def _write_limited(self, f: BinaryIO, data: BytesLike) -> int:
+        """
+        按 Token Bucket 消耗 token（必要时等待）后写入数据。
+        
+        参数:
+            f: 文件对象
+            data: 要写入的数据
+            
+        返回:
+            实际写入的字节数
+        """
+        self._wait(len(data))
+        return f.write(data)
+    
+    def _wait(self, size: int, _sleep=time.sleep) -> None:
+        """
+        从 Token Bucket 预留 size 字节的额度，额度不足时等待。
+        
+        参数:
+            size: 字节数
+        """
+        delay = self._bucket.reserve(size)
         
-        if elapsed > 0:
-            expected_time = self.bytes_read / self.speed_limit
-            if elapsed < expected_time:
-                time.sleep(expected_time - elapsed)
+        # 在锁外等待，多个下载线程可同时等待各自的额度；过短的等待不调用 sleep
+        if delay >= _MIN_SLEEP:
+            if self.jitter:
+                # 抖动造成的多等或少等会在后续补充中抵扣，不影响平均速度
+                delay *= self._random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+            _sleep(delay)
+
+
+class ThrottledWriter:
+    """
+    限速写入的文件包装器。
+    
+    推荐的限速写入方式：write() 经 SpeedLimiter 限速，退出上下文时写出
+    缓冲区中的剩余数据并刷新文件，调用方无需手动调用 flush()。
+    """
+    
+    def __init__(self, f: BinaryIO, limiter: SpeedLimiter):
+        """
+        初始化限速写入器。
         
-        self.last_time = time.time()
-        self.bytes_read = 0
+        参数:
+            f: 文件对象
+            limiter: 速度限制器（可在多个写入器之间共享）
+        """
+        self._f = f
+        self._limiter = limiter
+    
+    def write(self, data: BytesLike) -> int:
+        """
+        限速写入数据。
         
-        return written
+        参数:
+            data: 要写入的数据
+            
+        返回:
+            接受的字节数
+        """
+        return self._limiter.write_with_limit(self._f, data)
+    
+    def flush(self) -> None:
+        """写出缓冲区中的剩余数据并刷新文件。"""
+        self._limiter.flush(self._f)
+        self._f.flush()
+    
+    def __enter__(self) -> "ThrottledWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()